@@ -145,10 +145,10 @@ Hãy bắt đầu cuộc hội thoại thật chuyên nghiệp nhưng đầy c
         Run the agent with input and thread_id for memory persistence.
         """
         try:
-            # Store thread_id in a module-level variable so tools can access it
+            # Store thread_id in a context variable so tools can access it
             # This is a workaround since LangChain doesn't automatically pass context to tools
             import src.tools.booking_tools as booking_tools_module
-            booking_tools_module._current_thread_id = thread_id
+            booking_tools_module._current_thread_id.set(thread_id)
             
             # Config with thread_id
             config_run = {"configurable": {"thread_id": thread_id}}
@@ -23,6 +23,15 @@ class AssignmentService:
         self.token_secret = config.JWT_SECRET_KEY or "assignment-secret-key"
         self.token_expiry_days = 7
 
+    def _update_assignment(self, schedule_id: str, assignment_data: Dict) -> Optional[Dict]:
+        """Write assignment fields and patch the admin calendar with the updated event"""
+        updated_schedule = self.schedule_repo.update_assignment(schedule_id, assignment_data)
+        if updated_schedule:
+            # Imported here: schedule_service pulls in Qdrant and dateparser helpers
+            from .schedule_service import schedule_service
+            schedule_service.sync_admin_calendar_event(updated_schedule)
+        return updated_schedule
+
     def _generate_assignment_token(self, schedule_id: str, sale_id: str) -> str:
         """Generate JWT token for assignment confirmation/rejection"""
         payload = {
@@ -93,7 +102,7 @@ class AssignmentService:
             "sale_response_at": None,
         }
 
-        updated_schedule = self.schedule_repo.update_assignment(schedule_id, assignment_data)
+        updated_schedule = self._update_assignment(schedule_id, assignment_data)
         if not updated_schedule:
             raise DatabaseConnectionError("Không thể cập nhật lịch hẹn.")
 
@@ -144,7 +153,7 @@ class AssignmentService:
             "sale_response_at": datetime.utcnow().isoformat(),
         }
 
-        updated_schedule = self.schedule_repo.update_assignment(schedule_id, assignment_data)
+        updated_schedule = self._update_assignment(schedule_id, assignment_data)
         if not updated_schedule:
             raise DatabaseConnectionError("Không thể cập nhật lịch hẹn.")
 
@@ -191,7 +200,7 @@ class AssignmentService:
             "rejection_reason": reason,
         }
 
-        updated_schedule = self.schedule_repo.update_assignment(schedule_id, assignment_data)
+        updated_schedule = self._update_assignment(schedule_id, assignment_data)
         if not updated_schedule:
             raise DatabaseConnectionError("Không thể cập nhật lịch hẹn.")
 
@@ -239,7 +248,7 @@ class AssignmentService:
             "cancellation_reason": reason,
         }
 
-        updated_schedule = self.schedule_repo.update_assignment(schedule_id, assignment_data)
+        updated_schedule = self._update_assignment(schedule_id, assignment_data)
         if not updated_schedule:
             raise DatabaseConnectionError("Không thể cập nhật lịch hẹn.")
 
@@ -2,14 +2,67 @@
 Email service for sending verification emails using Google App Password
 """
 import smtplib
+from email.header import Header
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from calendar import monthrange
 from typing import Optional, Dict
 from datetime import datetime
+from functools import lru_cache
 
 from ..core.config import config
 from ..core.logger import logger
 
+
+def _encode_subject(subject: str) -> str:
+    """Encode a subject as an RFC 2047 encoded-word once, at import time"""
+    return Header(subject, "utf-8").encode()
+
+
+# Pre-encoded subjects (non-ASCII/emoji) so sends don't re-encode them
+_SUBJECT_VERIFICATION = _encode_subject("Xác thực tài khoản Chatbot Bất Động Sản")
+_SUBJECT_ASSIGNMENT = _encode_subject("📅 Bạn được phân công lịch hẹn xem nhà mới")
+_SUBJECT_CONFIRMATION = _encode_subject("✅ Đặt lịch xem nhà thành công")
+_SUBJECT_REJECTION = _encode_subject("⚠️ Sale từ chối lịch hẹn - Cần phân công lại")
+_SUBJECT_CANCELLATION = _encode_subject("❌ Khách hàng đã hủy lịch hẹn")
+_SUBJECT_PASSWORD_RESET = _encode_subject("🔐 Khôi phục mật khẩu Chatbot Bất Động Sản")
+
+
+@lru_cache(maxsize=1024)
+def _format_schedule_time(requested_time: str) -> str:
+    """
+    Format an ISO timestamp as "HH:MM, DD/MM/YYYY" for email bodies.
+    Stored timestamps share one layout (YYYY-MM-DDTHH:MM...), so the fields
+    are sliced directly; anything else goes through datetime.fromisoformat.
+    """
+    if not requested_time:
+        return "Chưa xác định"
+
+    value = requested_time
+    if (
+        isinstance(value, str)
+        and len(value) >= 16
+        and value[4] == "-" and value[7] == "-"
+        and value[10] in "T " and value[13] == ":"
+    ):
+        yy, mo, dd, hh, mm = value[0:4], value[5:7], value[8:10], value[11:13], value[14:16]
+        if (yy + mo + dd + hh + mm).isdigit():
+            year, month, day = int(yy), int(mo), int(dd)
+            # Out-of-range fields fall through to fromisoformat, which rejects them
+            if (
+                year >= 1 and 1 <= month <= 12
+                and 1 <= day <= monthrange(year, month)[1]
+                and int(hh) <= 23 and int(mm) <= 59
+            ):
+                return f"{hh}:{mm}, {dd}/{mo}/{yy}"
+
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return dt.strftime("%H:%M, %d/%m/%Y")
+    except Exception:
+        return requested_time
+
+
 class EmailService:
     """Service for sending emails"""
 
@@ -75,7 +128,7 @@ class EmailService:
 
     def send_verification_email(self, to_email: str, verification_code: str) -> bool:
         """Send verification email with OTP"""
-        subject = "Xác thực tài khoản Chatbot Bất Động Sản"
+        subject = _SUBJECT_VERIFICATION
         
         html_content = f"""
         <html>
@@ -108,18 +161,10 @@ class EmailService:
         reject_url: str
     ) -> bool:
         """Send assignment email to Sale with confirm/reject links"""
-        subject = "📅 Bạn được phân công lịch hẹn xem nhà mới"
+        subject = _SUBJECT_ASSIGNMENT
         
         # Format schedule time
-        requested_time = schedule.get("requested_time", "")
-        try:
-            if requested_time:
-                dt = datetime.fromisoformat(requested_time.replace("Z", "+00:00"))
-                time_display = dt.strftime("%H:%M, %d/%m/%Y")
-            else:
-                time_display = "Chưa xác định"
-        except:
-            time_display = requested_time
+        time_display = _format_schedule_time(schedule.get("requested_time", ""))
 
         html_content = f"""
         <html>
@@ -168,18 +213,10 @@ class EmailService:
         sale_info: Dict
     ) -> bool:
         """Send notification email to User when Sale confirms their booking"""
-        subject = "✅ Đặt lịch xem nhà thành công"
+        subject = _SUBJECT_CONFIRMATION
         
         # Format schedule time
-        requested_time = schedule.get("requested_time", "")
-        try:
-            if requested_time:
-                dt = datetime.fromisoformat(requested_time.replace("Z", "+00:00"))
-                time_display = dt.strftime("%H:%M, %d/%m/%Y")
-            else:
-                time_display = "Chưa xác định"
-        except:
-            time_display = requested_time
+        time_display = _format_schedule_time(schedule.get("requested_time", ""))
 
         sale_name = sale_info.get("name", "Nhân viên tư vấn")
         sale_email = sale_info.get("email", "")
@@ -219,18 +256,10 @@ class EmailService:
         reason: Optional[str] = None
     ) -> bool:
         """Send notification to Admin when Sale rejects"""
-        subject = "⚠️ Sale từ chối lịch hẹn - Cần phân công lại"
+        subject = _SUBJECT_REJECTION
         
         # Format schedule time
-        requested_time = schedule.get("requested_time", "")
-        try:
-            if requested_time:
-                dt = datetime.fromisoformat(requested_time.replace("Z", "+00:00"))
-                time_display = dt.strftime("%H:%M, %d/%m/%Y")
-            else:
-                time_display = "Chưa xác định"
-        except:
-            time_display = requested_time
+        time_display = _format_schedule_time(schedule.get("requested_time", ""))
 
         html_content = f"""
         <html>
@@ -266,18 +295,10 @@ class EmailService:
         reason: Optional[str] = None
     ) -> bool:
         """Send email to Sale when User cancels schedule"""
-        subject = "❌ Khách hàng đã hủy lịch hẹn"
+        subject = _SUBJECT_CANCELLATION
         
         # Format schedule time
-        requested_time = schedule.get("requested_time", "")
-        try:
-            if requested_time:
-                dt = datetime.fromisoformat(requested_time.replace("Z", "+00:00"))
-                time_display = dt.strftime("%H:%M, %d/%m/%Y")
-            else:
-                time_display = "Chưa xác định"
-        except:
-            time_display = requested_time
+        time_display = _format_schedule_time(schedule.get("requested_time", ""))
 
         html_content = f"""
         <html>
@@ -313,18 +334,10 @@ class EmailService:
         reason: Optional[str] = None
     ) -> bool:
         """Send notification to Admin when User cancels"""
-        subject = "❌ Khách hàng đã hủy lịch hẹn"
+        subject = _SUBJECT_CANCELLATION
         
         # Format schedule time
-        requested_time = schedule.get("requested_time", "")
-        try:
-            if requested_time:
-                dt = datetime.fromisoformat(requested_time.replace("Z", "+00:00"))
-                time_display = dt.strftime("%H:%M, %d/%m/%Y")
-            else:
-                time_display = "Chưa xác định"
-        except:
-            time_display = requested_time
+        time_display = _format_schedule_time(schedule.get("requested_time", ""))
 
         sale_info_text = ""
         if sale_info:
@@ -359,7 +372,7 @@ class EmailService:
 
     def send_password_reset_email(self, to_email: str, otp: str) -> bool:
         """Send password reset email with OTP"""
-        subject = "🔐 Khôi phục mật khẩu Chatbot Bất Động Sản"
+        subject = _SUBJECT_PASSWORD_RESET
         
         html_content = f"""
         <html>
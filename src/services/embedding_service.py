@@ -1,15 +1,20 @@
 """
 Embedding Service - Handle text vectorization
 """
+import threading
+from collections import OrderedDict
 from typing import List, Any
-from sentence_transformers import SentenceTransformer
 from ..core.config import config
 from ..core.logger import logger
 
+# Query vectors kept for repeated search texts (exact text match, LRU)
+QUERY_CACHE_SIZE = 1024
+
 class EmbeddingService:
     """Service for generating text embeddings"""
 
     _instance = None
+    _model_lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
@@ -22,36 +27,69 @@ class EmbeddingService:
             return
             
         self.model_name = config.EMBEDDING_MODEL_NAME
-        try:
-            logger.info(f"Loading embedding model: {self.model_name}...")
-            self.model = SentenceTransformer(self.model_name)
-            self._initialized = True
-            logger.info("Embedding model loaded successfully")
-        except Exception as e:
-            logger.error(f"Failed to load embedding model: {e}")
-            raise e
+        self._model = None
+        self._query_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        self._initialized = True
+
+    @property
+    def model(self):
+        """Get the SentenceTransformer model (lazy loaded on first use)"""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    # Imported here: sentence_transformers pulls in torch/transformers
+                    from sentence_transformers import SentenceTransformer
+                    try:
+                        logger.info(f"Loading embedding model: {self.model_name}...")
+                        self._model = SentenceTransformer(self.model_name)
+                        logger.info("Embedding model loaded successfully")
+                    except Exception as e:
+                        logger.error(f"Failed to load embedding model: {e}")
+                        raise e
+        return self._model
 
     @property
     def vector_dimension(self) -> int:
         """Get vector dimension of the model"""
         return self.model.get_sentence_embedding_dimension()
 
-    def encode(self, texts: List[str]) -> Any:
+    def encode(self, texts: List[str], batch_size: int = 32, show_progress_bar: bool = False) -> Any:
         """
         Generate embeddings for a list of texts
         
         Args:
             texts: List of strings to encode
+            batch_size: Number of texts per forward pass
+            show_progress_bar: Show sentence-transformers progress bar
             
         Returns:
             List of vectors (numpy arrays)
         """
         try:
-            return self.model.encode(texts)
+            return self.model.encode(texts, batch_size=batch_size, show_progress_bar=show_progress_bar)
         except Exception as e:
             logger.error(f"Error encoding texts: {e}")
             raise e
 
+    def encode_query(self, text: str) -> List[float]:
+        """
+        Vector (as a list) for one search query; repeated texts skip the model.
+        Callers must not mutate the returned list.
+        """
+        with self._query_cache_lock:
+            vector = self._query_cache.get(text)
+            if vector is not None:
+                self._query_cache.move_to_end(text)
+                return vector
+
+        vector = self.encode([text])[0].tolist()
+        with self._query_cache_lock:
+            self._query_cache[text] = vector
+            if len(self._query_cache) > QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+        return vector
+
 def get_embedding_service():
     """Get singleton instance of EmbeddingService"""
     return EmbeddingService()
@@ -3,10 +3,139 @@ Preprocessing Service
 Responsible for normalizing user input before NLU processing.
 """
 import re
+from functools import lru_cache
 from typing import Optional, Union, Dict, Any
 from ..core import settings
 from ..core.logger import logger
 
+# Aho-Corasick automaton (optional)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+# Pre-compiled patterns (avoid re-module cache lookups on every call)
+# Matches: "3 tỷ", "3.5 ty", "800 trieu", "800tr"
+_PRICE_RE = re.compile(r"(\d+(?:[.,]\d+)?)\s*(tỷ|ty|triệu|tr|nghìn|k)?")
+# Matches: "70m2", "70 m2", "70.5"
+_AREA_RE = re.compile(r"(\d+(?:[.,]\d+)?)\s*(m2|m vuông|mét vuông)?")
+# Runs of whitespace, collapsed to a single space
+_WS_RE = re.compile(r"\s+")
+
+
+def _build_automaton(mapping: Dict[str, str]):
+    """
+    Build a multi-pattern automaton over the mapping keys.
+    Each key stores (priority, value) so the earliest mapping entry still wins
+    when several keys match, exactly like the dict scan it replaces.
+    """
+    if not AHOCORASICK_AVAILABLE or not mapping:
+        return None
+    automaton = ahocorasick.Automaton()
+    for priority, (key, value) in enumerate(mapping.items()):
+        automaton.add_word(key, (priority, value))
+    automaton.make_automaton()
+    return automaton
+
+
+def _match_mapping(text_lower: str, mapping: Dict[str, str], automaton) -> Optional[str]:
+    """Return the value of the highest-priority mapping key contained in text_lower"""
+    if automaton is None:
+        for key, value in mapping.items():
+            if key in text_lower:
+                return value
+        return None
+
+    best = None
+    for _, match in automaton.iter(text_lower):
+        if best is None or match[0] < best[0]:
+            best = match
+    return best[1] if best else None
+
+
+_PROJECT_AC = _build_automaton(settings.PROJECT_NAME_MAPPING)
+_FURNITURE_AC = _build_automaton(settings.FURNITURE_MAPPING)
+
+# Chat traffic repeats the same phrases constantly, so normalization results
+# are memoized. The class methods short-circuit empty input before the cache.
+_NORMALIZE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _normalize_project_cached(text: str) -> Optional[str]:
+    text_lower = text.lower().strip()
+
+    # Check exact mappings first
+    return _match_mapping(text_lower, settings.PROJECT_NAME_MAPPING, _PROJECT_AC)
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _normalize_direction_cached(text: str) -> Optional[str]:
+    text_lower = text.lower().strip()
+    return settings.DIRECTION_SHORTCUTS.get(text_lower)
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _normalize_furniture_cached(text: str) -> Optional[str]:
+    text_lower = text.lower().strip()
+    return _match_mapping(text_lower, settings.FURNITURE_MAPPING, _FURNITURE_AC)
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _normalize_price_cached(text: str) -> Optional[int]:
+    text_lower = text.lower().strip()
+
+    # Simple regex for number + unit
+    match = _PRICE_RE.search(text_lower)
+
+    if match:
+        amount_str = match.group(1).replace(',', '.')
+        unit = match.group(2)
+
+        try:
+            amount = float(amount_str)
+
+            if unit in ["tỷ", "ty"]:
+                return int(amount * 1_000_000_000)
+            elif unit in ["triệu", "tr"]:
+                return int(amount * 1_000_000)
+            elif unit in ["nghìn", "k"]:
+                return int(amount * 1_000)
+            else:
+                # No unit, assume full number if large, or maybe billions if small?
+                # For safety, if < 1000, assume billions? No, that's risky.
+                # If user types "3000", is it 3000 VND or 3000 USD or 3000 Ty?
+                # Let's assume raw number if no unit.
+                return int(amount)
+        except ValueError:
+            return None
+
+    return None
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _normalize_area_cached(text: str) -> Optional[float]:
+    text_lower = text.lower().strip()
+
+    match = _AREA_RE.search(text_lower)
+
+    if match:
+        amount_str = match.group(1).replace(',', '.')
+        try:
+            return float(amount_str)
+        except ValueError:
+            return None
+
+    return None
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _normalize_text_cached(text: str) -> str:
+    return _WS_RE.sub(" ", text).strip().lower()
+
+
 class PreprocessingService:
     """Service for text normalization and preprocessing"""
 
@@ -17,15 +146,7 @@ class PreprocessingService:
         """
         if not text:
             return None
-            
-        text_lower = text.lower().strip()
-        
-        # Check exact mappings first
-        for key, value in settings.PROJECT_NAME_MAPPING.items():
-            if key in text_lower:
-                return value
-                
-        return None
+        return _normalize_project_cached(text)
 
     def normalize_direction(self, text: str) -> Optional[str]:
         """
@@ -34,9 +155,7 @@ class PreprocessingService:
         """
         if not text:
             return None
-            
-        text_lower = text.lower().strip()
-        return settings.DIRECTION_SHORTCUTS.get(text_lower)
+        return _normalize_direction_cached(text)
 
     def normalize_furniture(self, text: str) -> Optional[str]:
         """
@@ -45,14 +164,7 @@ class PreprocessingService:
         """
         if not text:
             return None
-            
-        text_lower = text.lower().strip()
-        
-        for key, value in settings.FURNITURE_MAPPING.items():
-            if key in text_lower:
-                return value
-                
-        return None
+        return _normalize_furniture_cached(text)
 
     def normalize_price(self, text: str) -> Optional[int]:
         """
@@ -61,36 +173,7 @@ class PreprocessingService:
         """
         if not text:
             return None
-            
-        text_lower = text.lower().strip()
-        
-        # Simple regex for number + unit
-        # Matches: "3 tỷ", "3.5 ty", "800 trieu", "800tr"
-        match = re.search(r"(\d+(?:[.,]\d+)?)\s*(tỷ|ty|triệu|tr|nghìn|k)?", text_lower)
-        
-        if match:
-            amount_str = match.group(1).replace(',', '.')
-            unit = match.group(2)
-            
-            try:
-                amount = float(amount_str)
-                
-                if unit in ["tỷ", "ty"]:
-                    return int(amount * 1_000_000_000)
-                elif unit in ["triệu", "tr"]:
-                    return int(amount * 1_000_000)
-                elif unit in ["nghìn", "k"]:
-                    return int(amount * 1_000)
-                else:
-                    # No unit, assume full number if large, or maybe billions if small?
-                    # For safety, if < 1000, assume billions? No, that's risky.
-                    # If user types "3000", is it 3000 VND or 3000 USD or 3000 Ty?
-                    # Let's assume raw number if no unit.
-                    return int(amount)
-            except ValueError:
-                return None
-                
-        return None
+        return _normalize_price_cached(text)
 
     def normalize_area(self, text: str) -> Optional[float]:
         """
@@ -99,20 +182,7 @@ class PreprocessingService:
         """
         if not text:
             return None
-            
-        text_lower = text.lower().strip()
-        
-        # Matches: "70m2", "70 m2", "70.5"
-        match = re.search(r"(\d+(?:[.,]\d+)?)\s*(m2|m vuông|mét vuông)?", text_lower)
-        
-        if match:
-            amount_str = match.group(1).replace(',', '.')
-            try:
-                return float(amount_str)
-            except ValueError:
-                return None
-                
-        return None
+        return _normalize_area_cached(text)
 
     def normalize_text(self, text: str) -> str:
         """
@@ -122,7 +192,7 @@ class PreprocessingService:
         """
         if not text:
             return ""
-        return " ".join(text.strip().split()).lower()
+        return _normalize_text_cached(text)
 
 # Singleton
 preprocessing_service = PreprocessingService()
@@ -4,8 +4,11 @@ Ported from reference implementation
 """
 import logging
 import os
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Union
+import pandas as pd
 from qdrant_client import QdrantClient, models
 from qdrant_client.http.models import Distance, VectorParams, PointStruct
 
@@ -13,6 +16,103 @@ from ..core.config import config
 from ..core.logger import logger
 from .embedding_service import embedding_service
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Bulk upload tuning (points per request, parallel upload workers)
+UPLOAD_BATCH_SIZE = 64
+UPLOAD_PARALLEL = 4
+
+# Listing payloads looked up by ma_can are reused for this many seconds
+LISTING_CACHE_TTL = 300
+_LISTING_CACHE_MAX = 1024
+
+# (field, prefix, suffix) for the embedding text, in output order.
+# The price part is inserted between the two groups.
+_TEXT_FIELDS_BEFORE_PRICE = [
+    ('ma_can', "Mã căn: ", ""),
+    ('toa', "Tòa: ", ""),
+    ('tang', "Tầng: ", ""),
+    ('so_phong_ngu', "", " phòng ngủ"),
+    ('so_phong_wc', "", " phòng WC"),
+    ('dien_tich', "Diện tích: ", " m²"),
+]
+_TEXT_FIELDS_AFTER_PRICE = [
+    ('huong', "Hướng: ", ""),
+    ('view', "View: ", ""),
+    ('noi_that', "Nội thất: ", ""),
+    ('nhu_cau', "Nhu cầu: ", ""),
+]
+
+
+def _uuid4_batch(count: int) -> List[str]:
+    """Generate `count` random UUID4 strings from a single os.urandom call"""
+    raw = os.urandom(16 * count)
+    return [str(uuid.UUID(bytes=raw[i * 16:(i + 1) * 16], version=4)) for i in range(count)]
+
+
+def _present(values: pd.Series) -> pd.Series:
+    """Mask of cells that hold a truthy value (same rule as `if record.get(field)`)"""
+    return values.notna() & values.astype(bool)
+
+
+def _format_column(df: pd.DataFrame, field: str, prefix: str, suffix: str) -> Optional[pd.Series]:
+    """Format one field column as text parts; rows without a value are NaN"""
+    if field not in df:
+        return None
+    values = df[field]
+    present = _present(values)
+    return (prefix + values[present].astype(str) + suffix).reindex(df.index)
+
+
+def _format_price(price: Any) -> Optional[str]:
+    if isinstance(price, dict):
+        if price.get('min') and price.get('max'):
+            return f"Giá: {price['min']//1000000}-{price['max']//1000000} triệu"
+        if price.get('max'):
+            return f"Giá: dưới {price['max']//1000000} triệu"
+    elif isinstance(price, (int, float)):
+        return f"Giá: {price//1000000} triệu"
+    return None
+
+
+def _format_price_column(df: pd.DataFrame) -> Optional[pd.Series]:
+    if 'gia_ban' not in df:
+        return None
+    values = df['gia_ban']
+    present = _present(values)
+    return values[present].map(_format_price).reindex(df.index)
+
+
+def _build_text_representations(records: List[Dict]) -> List[str]:
+    """
+    Build the embedding text for every record.
+    Records are loaded into a DataFrame and each field is formatted as a whole
+    column; the parts are then joined per row with ". ".
+    """
+    if not records:
+        return []
+
+    df = pd.DataFrame(records, dtype=object)
+    columns = [_format_column(df, *spec) for spec in _TEXT_FIELDS_BEFORE_PRICE]
+    columns.append(_format_price_column(df))
+    columns.extend(_format_column(df, *spec) for spec in _TEXT_FIELDS_AFTER_PRICE)
+    columns = [col for col in columns if col is not None]
+    if not columns:
+        return [""] * len(records)
+
+    parts = pd.concat(columns, axis=1, ignore_index=True)
+    joined = (
+        parts.stack(future_stack=True)
+        .dropna()
+        .groupby(level=0)
+        .agg(". ".join)
+    )
+    return joined.reindex(df.index, fill_value="").tolist()
+
 class QdrantService:
     """
     Service for interacting with Qdrant Vector Database.
@@ -37,13 +137,13 @@ class QdrantService:
             logger.error(f"Failed to connect to Qdrant: {e}")
             raise e
 
+        # ma_can -> (fetched at, payload or None)
+        self._listing_cache: Dict[str, tuple] = {}
+
     def create_collection_if_not_exists(self, collection_name: str, vector_size: int = 768, distance: Distance = Distance.COSINE):
         """Create a collection if it doesn't exist"""
         try:
-            collections = self.client.get_collections()
-            exists = any(c.name == collection_name for c in collections.collections)
-            
-            if not exists:
+            if not self.client.collection_exists(collection_name):
                 self.client.create_collection(
                     collection_name=collection_name,
                     vectors_config=VectorParams(size=vector_size, distance=distance)
@@ -55,12 +155,12 @@ class QdrantService:
             logger.error(f"Error creating collection {collection_name}: {e}")
             raise e
 
-    def upsert_points(self, collection_name: str, points: List[PointStruct]):
+    def upsert_points(self, collection_name: str, points: List[PointStruct], wait: bool = True):
         """Upsert points (vectors + payload) into the collection"""
         try:
             operation_info = self.client.upsert(
                 collection_name=collection_name,
-                wait=True,
+                wait=wait,
                 points=points
             )
             logger.info(f"Upserted {len(points)} points to '{collection_name}'. Status: {operation_info.status}")
@@ -69,7 +169,7 @@ class QdrantService:
             logger.error(f"Error upserting points to {collection_name}: {e}")
             raise e
 
-    def query_points(self, collection_name: str, query: List[float], limit: int = 10, query_filter: Optional[models.Filter] = None, with_payload: bool = True) -> models.QueryResponse:
+    def query_points(self, collection_name: str, query: Union[List[float], models.Query], limit: int = 10, query_filter: Optional[models.Filter] = None, with_payload: Union[bool, List[str]] = True) -> models.QueryResponse:
         """
         Search using query_points API (more flexible)
         """
@@ -87,6 +187,88 @@ class QdrantService:
             logger.error(f"Error querying points in {collection_name}: {e}")
             raise e
 
+    def get_listing_payload(self, ma_can: str) -> Optional[Dict[str, Any]]:
+        """
+        Payload of the listing with this ma_can in the default collection, or None.
+        Cached for LISTING_CACHE_TTL seconds (misses too); Qdrant errors propagate
+        and are not cached. Callers must not mutate the returned dict.
+        """
+        cached = self._listing_cache.get(ma_can)
+        if cached and time.monotonic() - cached[0] < LISTING_CACHE_TTL:
+            return cached[1]
+
+        points, _ = self.client.scroll(
+            collection_name=self.collection_name,
+            scroll_filter=models.Filter(must=[
+                models.FieldCondition(key="ma_can", match=models.MatchValue(value=ma_can))
+            ]),
+            limit=1
+        )
+        payload = points[0].payload if points and points[0].payload else None
+        if len(self._listing_cache) >= _LISTING_CACHE_MAX:
+            self._listing_cache.clear()
+        self._listing_cache[ma_can] = (time.monotonic(), payload)
+        return payload
+
+    def get_listing_payloads(self, ma_cans: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Batch form of get_listing_payload: {ma_can: payload or None}.
+        Uncached ids are fetched with one MatchAny scroll (more pages only when
+        re-uploaded duplicates crowd the first one).
+        """
+        now = time.monotonic()
+        found: Dict[str, Optional[Dict[str, Any]]] = {}
+        missing = []
+        for ma_can in dict.fromkeys(ma_cans):
+            cached = self._listing_cache.get(ma_can)
+            if cached and now - cached[0] < LISTING_CACHE_TTL:
+                found[ma_can] = cached[1]
+            else:
+                missing.append(ma_can)
+
+        if missing:
+            fetched: Dict[str, Dict[str, Any]] = {}
+            offset = None
+            while True:
+                points, offset = self.client.scroll(
+                    collection_name=self.collection_name,
+                    scroll_filter=models.Filter(must=[
+                        models.FieldCondition(key="ma_can", match=models.MatchAny(any=missing))
+                    ]),
+                    limit=len(missing),
+                    offset=offset,
+                    with_payload=True,
+                    with_vectors=False
+                )
+                for point in points:
+                    ma_can = point.payload.get("ma_can") if point.payload else None
+                    if ma_can is not None and ma_can not in fetched:
+                        fetched[ma_can] = point.payload
+                if offset is None or len(fetched) == len(missing):
+                    break
+
+            now = time.monotonic()
+            for ma_can in missing:
+                payload = fetched.get(ma_can)
+                if len(self._listing_cache) >= _LISTING_CACHE_MAX:
+                    self._listing_cache.clear()
+                self._listing_cache[ma_can] = (now, payload)
+                found[ma_can] = payload
+        return found
+
+    def cache_listing_payloads(self, payloads: List[Dict[str, Any]]):
+        """
+        Seed the ma_can cache with full payloads already fetched by a search,
+        so booking a listing the user just saw needs no extra lookup.
+        """
+        now = time.monotonic()
+        for payload in payloads:
+            ma_can = payload.get("ma_can") if payload else None
+            if ma_can:
+                if len(self._listing_cache) >= _LISTING_CACHE_MAX:
+                    self._listing_cache.clear()
+                self._listing_cache[ma_can] = (now, payload)
+
     def create_payload_index(self, collection_name: str, field_name: str, field_schema: Optional[models.PayloadSchemaType] = None):
         """Create an index for a payload field"""
         try:
@@ -100,16 +282,26 @@ class QdrantService:
             logger.error(f"Error creating index for {field_name} in {collection_name}: {e}")
             raise e
 
+    def _safe_create_index(self, collection_name: str, field_name: str, field_schema: Optional[models.PayloadSchemaType] = None):
+        """Create a payload index, logging instead of raising on failure"""
+        try:
+            self.create_payload_index(collection_name, field_name, field_schema)
+        except Exception as e:
+            logger.warning(f"Could not create index for {field_name}: {e}")
+
     def upload_from_json(self, json_path: str, collection_name: Optional[str] = None):
         """
         Upload apartment data from JSON file to Qdrant.
         """
-        import json
-        
         try:
             # Load JSON data
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if HAS_ORJSON:
+                with open(json_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                import json
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
             
             if 'data' not in data or not isinstance(data['data'], list):
                 raise ValueError("Invalid JSON structure: missing 'data' array")
@@ -138,68 +330,56 @@ class QdrantService:
                 ('dien_tich', models.PayloadSchemaType.FLOAT), # For range filter
             ]
             
-            for field_name, field_type in important_fields:
-                try:
-                    self.create_payload_index(target_collection, field_name, field_type)
-                except Exception as e:
-                    logger.warning(f"Could not create index for {field_name}: {e}")
+            # Index creations are independent; fire them concurrently
+            with ThreadPoolExecutor(max_workers=len(important_fields)) as executor:
+                list(executor.map(
+                    lambda field: self._safe_create_index(target_collection, *field),
+                    important_fields
+                ))
             
-            # Prepare points for upload
-            points = []
-            for idx, record in enumerate(records):
-                # Generate text representation for embedding
-                text_parts = []
-                
-                if record.get('ma_can'): text_parts.append(f"Mã căn: {record['ma_can']}")
-                if record.get('toa'): text_parts.append(f"Tòa: {record['toa']}")
-                if record.get('tang'): text_parts.append(f"Tầng: {record['tang']}")
-                if record.get('so_phong_ngu'): text_parts.append(f"{record['so_phong_ngu']} phòng ngủ")
-                if record.get('so_phong_wc'): text_parts.append(f"{record['so_phong_wc']} phòng WC")
-                if record.get('dien_tich'): text_parts.append(f"Diện tích: {record['dien_tich']} m²")
-                
-                if record.get('gia_ban'):
-                    price = record['gia_ban']
-                    if isinstance(price, dict):
-                        if price.get('min') and price.get('max'):
-                            text_parts.append(f"Giá: {price['min']//1000000}-{price['max']//1000000} triệu")
-                        elif price.get('max'):
-                            text_parts.append(f"Giá: dưới {price['max']//1000000} triệu")
-                    elif isinstance(price, (int, float)):
-                        text_parts.append(f"Giá: {price//1000000} triệu")
-                
-                if record.get('huong'): text_parts.append(f"Hướng: {record['huong']}")
-                if record.get('view'): text_parts.append(f"View: {record['view']}")
-                if record.get('noi_that'): text_parts.append(f"Nội thất: {record['noi_that']}")
-                if record.get('nhu_cau'): text_parts.append(f"Nhu cầu: {record['nhu_cau']}")
-                
-                text_representation = ". ".join(text_parts)
-                
-                # Generate embedding
-                vector = embedding_service.encode([text_representation])[0].tolist()
-                
-                # Create point
-                point_id = str(uuid.uuid4())
-                point = PointStruct(
-                    id=point_id,
-                    vector=vector,
-                    payload={
-                        **record,
-                        'text_representation': text_representation,
-                        'source_file': data.get('source_file'),
-                        'batch_id': data.get('batch_id')
-                    }
-                )
-                points.append(point)
+            # Phase 1: build text representations for embedding (column-wise)
+            texts = _build_text_representations(records)
             
-            # Upload in batches
-            batch_size = 50
+            # Phase 2: stream points to Qdrant. Embeddings are computed one
+            # upload batch at a time, so only O(batch_size) vectors are resident
+            # while the client serializes and uploads in parallel workers.
             total_uploaded = 0
+            point_ids = _uuid4_batch(len(records))
             
-            for i in range(0, len(points), batch_size):
-                batch = points[i:i+batch_size]
-                self.upsert_points(target_collection, batch)
-                total_uploaded += len(batch)
-                logger.info(f"Uploaded batch {i//batch_size + 1}: {total_uploaded}/{len(points)} points")
+            def point_generator():
+                nonlocal total_uploaded
+                for start in range(0, len(records), UPLOAD_BATCH_SIZE):
+                    batch_texts = texts[start:start + UPLOAD_BATCH_SIZE]
+                    vectors = embedding_service.encode(
+                        batch_texts, batch_size=UPLOAD_BATCH_SIZE, show_progress_bar=False
+                    )
+                    for record, text_representation, vector, point_id in zip(
+                        records[start:start + UPLOAD_BATCH_SIZE], batch_texts, vectors,
+                        point_ids[start:start + UPLOAD_BATCH_SIZE]
+                    ):
+                        total_uploaded += 1
+                        yield PointStruct(
+                            id=point_id,
+                            vector=vector.tolist(),
+                            payload={
+                                **record,
+                                'text_representation': text_representation,
+                                'source_file': data.get('source_file'),
+                                'batch_id': data.get('batch_id')
+                            }
+                        )
+                    logger.info(f"Prepared {total_uploaded}/{len(records)} points for upload")
+            
+            self.client.upload_points(
+                collection_name=target_collection,
+                points=point_generator(),
+                batch_size=UPLOAD_BATCH_SIZE,
+                parallel=UPLOAD_PARALLEL,
+                wait=True
+            )
+            logger.info(f"Uploaded {total_uploaded} points to '{target_collection}'")
+            # Listings may have changed under cached ma_can lookups
+            self._listing_cache.clear()
             
             return {
                 'success': True,
@@ -3,13 +3,17 @@ Schedule service - create and manage property visit appointments.
 """
 from __future__ import annotations
 
+import atexit
 import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+import logging
+import os
+import threading
+import time as _time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 import uuid
 
-import dateparser
-from dateparser.search import search_dates
 import re
 import unicodedata
 
@@ -20,7 +24,360 @@ from ..schemas.user import UserSession, UserRole
 from ..core.exceptions import ValidationError, DatabaseConnectionError, AuthenticationError
 from ..services.qdrant_service import qdrant_service
 from ..utils.listing_utils import extract_district_from_listing
-from qdrant_client.http import models
+
+# dateparser compiles its locale data on import; it is loaded on first use
+if TYPE_CHECKING:
+    from dateparser.date import DateDataParser
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Bursts of admin-calendar syncs within this window are written once (seconds)
+ADMIN_CALENDAR_SYNC_DEBOUNCE = 0.5
+# The in-memory calendar is re-read from the repository after this long (seconds),
+# picking up writes from other processes sharing the database. In-process writers
+# outside this service (sale assignment) patch it via sync_admin_calendar_event.
+ADMIN_CALENDAR_RELOAD_INTERVAL = 300
+# Seconds a fetched user record is reused across booking lookups
+USER_CACHE_TTL = 60
+_USER_CACHE_MAX = 1024
+
+# Payload keys tried in order by _parse_datetime: structured values first, then free text
+_CANDIDATE_KEYS = (
+    "iso_datetime", "datetime", "scheduled_for",
+    "preferred_time", "time_text", "visit_time", "when", "time",
+)
+
+# "7 giờ rưỡi", "7h rưỡi" (checked before _PAT_FULL)
+_PAT_RUOI = re.compile(r'(\d{1,2})\s*(?:giờ|g|h)?\s*(rưỡi|ruoi)', flags=re.UNICODE)
+# "7 giờ sáng", "5 giờ 30 chiều", "17h30"
+_PAT_FULL = re.compile(
+    r'(\d{1,2})\s*(?:[:h]|giờ|g)\s*(\d{1,2})?\s*(?:phút)?\s*(sáng|chiều|tối|trưa|am|pm)?',
+    flags=re.UNICODE
+)
+# Suffixes captured by _PAT_FULL, already normalized
+_SUFFIX_NORM = {"sáng": "sang", "chiều": "chieu", "tối": "toi", "trưa": "trua", "am": "am", "pm": "pm"}
+# Part-of-day substrings of normalized text; the lookahead also reports
+# overlapping hits ("truam" contains both "trua" and "am")
+_PAT_DAY_PART = re.compile(r'(?=(chieu|toi|pm|sang|am|trua))')
+_EVENING_WORDS = frozenset({"chieu", "toi", "pm"})
+_MORNING_WORDS = frozenset({"sang", "am"})
+# Relative day words on normalized text ("ngày mai", "mốt", "ngày kia")
+_PAT_REL_DATE = re.compile(r'\b(?:ngay\s+)?(mai|mot|kia)\b')
+# "User: ..." lines of a formatted conversation context (any case, spaces allowed)
+_PAT_USER_LINE = re.compile(r'^[^\S\n]*user[^\S\n]*:(.*)$', flags=re.MULTILINE | re.IGNORECASE)
+_PAT_QUAN = re.compile(r'quan\s*(\d+)', flags=re.UNICODE)
+
+class _FoldTable(dict):
+    """
+    str.translate table: codepoint -> NFKD form without combining marks.
+    Filled on first sight of a codepoint, so translate() gives exactly the
+    old NFKD + filter result in one C-level pass.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        decomposed = unicodedata.normalize("NFKD", chr(codepoint))
+        folded = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+        self[codepoint] = folded
+        return folded
+
+
+_VN_FOLD = _FoldTable()
+# Pre-fill ASCII, Latin-1/Extended-A/B and the Vietnamese block (U+1EA0-U+1EF9)
+for _codepoint in (*range(0x80), *range(0xC0, 0x250), *range(0x300, 0x370), *range(0x1EA0, 0x1EFA)):
+    _VN_FOLD[_codepoint]
+del _codepoint
+
+
+@lru_cache(maxsize=4096)
+def _fold_text(text: str) -> str:
+    return text.translate(_VN_FOLD).lower()
+
+
+def _start_of_day(base_dt: datetime, days: int = 0) -> datetime:
+    """Naive midnight `days` days after base_dt, without a date() + combine round trip"""
+    return base_dt.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None) + timedelta(days=days)
+
+
+@lru_cache(maxsize=1024)
+def _scan_day_parts(normalized: str) -> frozenset:
+    """Every part-of-day word occurring in normalized text, from one regex scan"""
+    return frozenset(_PAT_DAY_PART.findall(normalized))
+
+
+# Surface forms of weekday tokens (lowercased, single-spaced) -> weekday();
+# anything else goes through the normalizing path in _weekday_from_token
+_WEEKDAY_NAMES = {
+    "hai": 0, "2": 0,
+    "ba": 1, "3": 1,
+    "tư": 2, "tu": 2, "bốn": 2, "bon": 2, "4": 2,
+    "năm": 3, "nam": 3, "5": 3,
+    "sáu": 4, "sau": 4, "6": 4,
+    "bảy": 5, "bay": 5, "7": 5,
+}
+_WEEKDAY_MAP = {"chủ nhật": 6, "chu nhat": 6, "chủnhật": 6, "chunhat": 6, "cn": 6}
+for _prefix in ("thứ", "thu"):
+    for _name, _weekday in _WEEKDAY_NAMES.items():
+        _WEEKDAY_MAP[f"{_prefix} {_name}"] = _weekday
+        _WEEKDAY_MAP[f"{_prefix}{_name}"] = _weekday
+del _prefix, _name, _weekday
+
+
+@lru_cache(maxsize=4096)
+def _weekday_from_token(token: str) -> Optional[int]:
+    weekday = _WEEKDAY_MAP.get(" ".join(token.lower().split()))
+    if weekday is None:
+        # Folded forms ("thư hai", "Chủ  Nhật") are among the unaccented keys
+        weekday = _WEEKDAY_MAP.get(" ".join(_fold_text(token).split()))
+    return weekday
+
+def _isoformat_default(value):
+    """json.dump default: datetimes as isoformat(), like orjson does."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> Optional[datetime]:
+    # ISO dates always start with a 4-digit year; skip the raise/catch for prose
+    if not value[:4].isdigit():
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00") if value.endswith("Z") else value)
+    except ValueError:
+        return None
+
+
+# Cheap pre-filter before dateparser: date/time text almost always has a digit
+_HAS_DIGIT = re.compile(r'\d')
+_RELATIVE_WORDS = frozenset({"hôm nay", "ngày mai", "mai", "tomorrow", "today"})
+
+
+_DATEPARSER_CACHE_SIZE = 2048
+# dateparser's defaults minus "timestamp": a phone number in the booking text
+# ("0912345678") would otherwise parse as an epoch date in 1998
+_DATEPARSER_PARSERS = ["relative-time", "custom-formats", "absolute-time"]
+
+
+@lru_cache(maxsize=2)
+def _date_data_parser(base_minute: datetime) -> DateDataParser:
+    """
+    One DateDataParser per minute (building one is expensive, and dateparser.parse
+    builds a new one on every call when languages/settings are given).
+    RELATIVE_BASE keeps the time of day so "in 2 hours" stays in the future.
+    """
+    from dateparser.date import DateDataParser
+
+    return DateDataParser(
+        languages=["vi", "en"],
+        settings={
+            "PREFER_DATES_FROM": "future",
+            "RELATIVE_BASE": base_minute,
+            "PARSERS": _DATEPARSER_PARSERS,
+        },
+    )
+
+
+@lru_cache(maxsize=_DATEPARSER_CACHE_SIZE)
+def _dateparser_parse_cached(value: str, base_minute: datetime) -> Optional[datetime]:
+    """
+    Cached dateparser parse keyed by (text, minute), including misses (None).
+    Repeated phrases ("10h sáng thứ 7", "ngày mai") hit the cache within the minute.
+    """
+    data = _date_data_parser(base_minute).get_date_data(value)
+    return data["date_obj"] if data else None
+
+
+@lru_cache(maxsize=_DATEPARSER_CACHE_SIZE)
+def _search_dates_cached(text: str, base_minute: datetime) -> Optional[Tuple[Tuple[str, datetime], ...]]:
+    """
+    Cached search_dates keyed by (text, minute).
+    Matches here are used as-is (no time hint afterwards), so RELATIVE_BASE
+    keeps the time of day and is only truncated to the minute.
+    """
+    from dateparser.search import search_dates
+
+    matches = search_dates(
+        text,
+        languages=["vi", "en"],
+        settings={
+            "PREFER_DATES_FROM": "future",
+            "RELATIVE_BASE": base_minute,
+            "PARSERS": _DATEPARSER_PARSERS,
+        },
+    )
+    return tuple(matches) if matches else None
+
+
+@lru_cache(maxsize=1024)
+def _time_hint_from_text(text: str) -> Optional[Tuple[int, int, Optional[str]]]:
+    """(hour, minute, suffix) from the first usable clock expression in text."""
+    # Both patterns need a digit; most chat lines have none
+    if not _HAS_DIGIT.search(text):
+        return None
+    lowered = text.lower()
+    
+    # Pattern cho "rưỡi" trước (ưu tiên cao hơn)
+    for match in _PAT_RUOI.finditer(lowered):
+        hour = int(match.group(1))
+        if hour > 23:
+            continue
+        return hour, 30, None
+    
+    # Pattern cho giờ đầy đủ: "7 giờ sáng", "5 giờ 30 chiều", "17h30"
+    for match in _PAT_FULL.finditer(lowered):
+        hour = int(match.group(1))
+        minute = int(match.group(2)) if match.group(2) else 0
+        suffix = match.group(3)
+        if hour > 23 or minute > 59:
+            continue
+        # Nếu có suffix (sáng/chiều/tối/trưa/am/pm) thì luôn trả về
+        if suffix:
+            return hour, minute, suffix
+        # Nếu không có suffix nhưng hour >= 12, có thể là 24h format
+        if hour >= 12:
+            return hour, minute, None
+        # Nếu hour < 12 và không có suffix, cần kiểm tra context
+        # Nhưng để đơn giản, nếu không có suffix và hour < 12 thì skip
+        # (sẽ được xử lý bởi logic khác)
+    return None
+
+
+# Token kinds emitted by ScheduleService._vn_time_dfa
+_TOK_RELATIVE_DAY = "RELATIVE_DAY"
+_TOK_WEEKDAY = "WEEKDAY"
+_TOK_WEEK = "WEEK"
+_TOK_PART_OF_DAY = "PART_OF_DAY"
+_TOK_CLOCK = "CLOCK"
+_TOK_FILLER = "FILLER"
+
+_VN_TIME_KEYWORDS: Dict[str, Tuple[str, object]] = {
+    "mai": (_TOK_RELATIVE_DAY, 1), "ngay mai": (_TOK_RELATIVE_DAY, 1),
+    "mot": (_TOK_RELATIVE_DAY, 2), "ngay mot": (_TOK_RELATIVE_DAY, 2),
+    "kia": (_TOK_RELATIVE_DAY, 2), "ngay kia": (_TOK_RELATIVE_DAY, 2),
+    "hom nay": (_TOK_RELATIVE_DAY, 0), "nay": (_TOK_RELATIVE_DAY, 0),
+    "chu nhat": (_TOK_WEEKDAY, 6), "chunhat": (_TOK_WEEKDAY, 6), "cn": (_TOK_WEEKDAY, 6),
+    "tuan nay": (_TOK_WEEK, "nay"), "tuan sau": (_TOK_WEEK, "sau"), "tuan toi": (_TOK_WEEK, "toi"),
+    "sang": (_TOK_PART_OF_DAY, "sang"), "trua": (_TOK_PART_OF_DAY, "trua"),
+    "chieu": (_TOK_PART_OF_DAY, "chieu"), "toi": (_TOK_PART_OF_DAY, "toi"),
+    "am": (_TOK_PART_OF_DAY, "am"), "pm": (_TOK_PART_OF_DAY, "pm"),
+    "luc": (_TOK_FILLER, None), "vao": (_TOK_FILLER, None),
+}
+for _names, _weekday in (
+    (("hai", "2"), 0), (("ba", "3"), 1), (("tu", "bon", "4"), 2),
+    (("nam", "5"), 3), (("sau", "6"), 4), (("bay", "7"), 5),
+):
+    for _name in _names:
+        _VN_TIME_KEYWORDS[f"thu {_name}"] = (_TOK_WEEKDAY, _weekday)
+        if _name.isdigit():
+            _VN_TIME_KEYWORDS[f"thu{_name}"] = (_TOK_WEEKDAY, _weekday)
+
+# Character transition table (dict-of-dicts); "" marks an accepting state
+_VN_TIME_TRIE: Dict[str, dict] = {}
+for _keyword, _token in _VN_TIME_KEYWORDS.items():
+    _node = _VN_TIME_TRIE
+    for _ch in _keyword:
+        _node = _node.setdefault(_ch, {})
+    _node[""] = _token
+del _names, _weekday, _name, _keyword, _token, _node, _ch
+
+
+def _is_boundary(text: str, pos: int) -> bool:
+    return pos >= len(text) or text[pos] == " "
+
+
+def _read_digits(text: str, pos: int) -> int:
+    end = pos
+    while end < len(text) and "0" <= text[end] <= "9":
+        end += 1
+    return end
+
+
+def _scan_clock(text: str, pos: int) -> Optional[Tuple[Tuple[str, object], int]]:
+    """
+    Scan a clock time starting at a digit: "17h30", "7 giờ 45 phút",
+    "7g", "10:30", "7 giờ rưỡi". Returns (token, next_pos) or None.
+    """
+    end = _read_digits(text, pos)
+    if end - pos > 2:
+        return None
+    hour, minute = int(text[pos:end]), 0
+
+    cursor = end + 1 if end < len(text) and text[end] == " " else end
+    has_unit = False
+    if text.startswith("gio", cursor) and _is_boundary(text, cursor + 3):
+        cursor, has_unit = cursor + 3, True
+    elif cursor < len(text) and text[cursor] in "hg:" and (
+        _is_boundary(text, cursor + 1) or "0" <= text[cursor + 1] <= "9"
+    ):
+        cursor, has_unit = cursor + 1, True
+
+    nxt = cursor + 1 if cursor < len(text) and text[cursor] == " " else cursor
+    if text.startswith("ruoi", nxt) and _is_boundary(text, nxt + 4):
+        cursor, minute = nxt + 4, 30
+    elif not has_unit:
+        return None
+    elif nxt < len(text) and "0" <= text[nxt] <= "9":
+        minute_end = _read_digits(text, nxt)
+        if minute_end - nxt > 2:
+            return None
+        cursor, minute = minute_end, int(text[nxt:minute_end])
+        after = cursor + 1 if cursor < len(text) and text[cursor] == " " else cursor
+        if text.startswith("phut", after) and _is_boundary(text, after + 4):
+            cursor = after + 4
+
+    if not _is_boundary(text, cursor) or hour > 23 or minute > 59:
+        return None
+    return (_TOK_CLOCK, (hour, minute)), cursor
+
+
+# One admin-calendar writer per process, started on the first sync request.
+# Pending services sit in a dict rather than a queue the worker pops from,
+# so the atexit flush also sees requests still inside the debounce window.
+_calendar_pending: Dict[int, "ScheduleService"] = {}
+_calendar_pending_lock = threading.Lock()
+# Held for a whole flush, so the exit flush waits for an in-progress one
+_calendar_write_lock = threading.Lock()
+_calendar_wakeup = threading.Event()
+_calendar_thread: Optional[threading.Thread] = None
+
+
+def _request_calendar_sync(service: "ScheduleService"):
+    global _calendar_thread
+    with _calendar_pending_lock:
+        _calendar_pending[id(service)] = service
+        if _calendar_thread is None:
+            _calendar_thread = threading.Thread(
+                target=_admin_calendar_worker,
+                name="admin-calendar-sync",
+                daemon=True,
+            )
+            _calendar_thread.start()
+            atexit.register(_flush_calendar_syncs)
+    _calendar_wakeup.set()
+
+
+def _flush_calendar_syncs():
+    """Write the admin calendar for every service with pending changes"""
+    with _calendar_write_lock:
+        with _calendar_pending_lock:
+            services = list(_calendar_pending.values())
+            _calendar_pending.clear()
+        for service in services:
+            service._write_admin_calendar()
+
+
+def _admin_calendar_worker():
+    while True:
+        _calendar_wakeup.wait()
+        _calendar_wakeup.clear()
+        # Coalesce every request that arrives within the debounce window
+        _time.sleep(ADMIN_CALENDAR_SYNC_DEBOUNCE)
+        _flush_calendar_syncs()
 
 
 class ScheduleService:
@@ -34,8 +391,24 @@ class ScheduleService:
 
     def __init__(self):
         self.repo = schedule_repository
+        # Admin calendar file is rewritten off the request path by the shared
+        # calendar worker (_request_calendar_sync)
+        # id -> event, patched on create/update/delete instead of re-listing every write
+        self._calendar_cache: Optional[Dict[str, Dict]] = None
+        self._calendar_loaded_at = 0.0
+        self._calendar_lock = threading.Lock()
+        # Built on first use; UserRepository() re-creates its indexes on construction
+        self._user_repo = None
+        # user_id -> (fetched at, UserInDB); one booking looks the same user up several times
+        self._user_cache: Dict[str, tuple] = {}
 
     # ------------------ Helpers ------------------ #
+    def _get_user_repo(self):
+        if self._user_repo is None:
+            from ..repositories.user_repository import UserRepository
+            self._user_repo = UserRepository()
+        return self._user_repo
+
     def _parse_datetime(self, payload: Dict, fallback_text: Optional[str] = None) -> Tuple[Optional[datetime], str]:
         """
         Attempt to extract datetime from structured payload.
@@ -43,20 +416,22 @@ class ScheduleService:
         """
         base_dt = datetime.now()
 
-        candidates = [
-            payload.get("iso_datetime"),
-            payload.get("datetime"),
-            payload.get("scheduled_for"),
-        ]
-
-        time_text_keys = ["preferred_time", "time_text", "visit_time", "when", "time"]
-        for key in time_text_keys:
-            if payload.get(key):
-                candidates.append(payload[key])
-
-        for candidate in candidates:
-            if not candidate:
+        seen = set()
+        for key in _CANDIDATE_KEYS:
+            candidate = payload.get(key)
+            # The same text under several keys ("thứ 7" as preferred_time and time)
+            # would only fail the same way again
+            if not candidate or str(candidate) in seen:
                 continue
+            seen.add(str(candidate))
+            if isinstance(candidate, str):
+                # Payload ISO strings skip the phrase DFA and dateparser entirely
+                iso_dt = _parse_iso(candidate)
+                if iso_dt:
+                    return self._apply_time_hint(iso_dt, candidate), candidate
+                phrase_dt = self._parse_vn_phrase(candidate, base_dt)
+                if phrase_dt:
+                    return phrase_dt, candidate
             parsed = self._parse_single_candidate(candidate, base_dt=base_dt)
             if parsed:
                 parsed = self._apply_time_hint(parsed, str(candidate))
@@ -68,6 +443,10 @@ class ScheduleService:
                 return relative_dt, str(candidate)
 
         if fallback_text:
+            phrase_dt = self._parse_vn_phrase(fallback_text, base_dt)
+            if phrase_dt:
+                return phrase_dt, fallback_text
+
             # Thử parse "ngày mốt", "ngày kia", "mai" trước
             relative_date = self._parse_relative_date(fallback_text, base_dt)
             if relative_date:
@@ -92,17 +471,79 @@ class ScheduleService:
 
         return None, ""
 
+    @classmethod
+    def _vn_time_dfa(cls, text: Optional[str]) -> Optional[List[Tuple[str, object]]]:
+        """
+        Single left-to-right scan of the supported Vietnamese phrase set
+        ("mai", "ngày mốt", "thứ 7 tuần sau", "10h sáng", "7 giờ rưỡi chiều").
+        Returns the token list, or None when any part of the text is not
+        recognised (the caller then falls back to dateparser).
+        """
+        if not text:
+            return None
+        normalized = " ".join(cls._normalize_text(text).replace(",", " ").split())
+        tokens: List[Tuple[str, object]] = []
+        pos, length = 0, len(normalized)
+        while pos < length:
+            if normalized[pos] == " ":
+                pos += 1
+                continue
+            if "0" <= normalized[pos] <= "9":
+                scanned = _scan_clock(normalized, pos)
+                if scanned is None:
+                    return None
+                token, pos = scanned
+                tokens.append(token)
+                continue
+            # Longest keyword accepted by the transition table
+            node, cursor, accepted = _VN_TIME_TRIE, pos, None
+            while cursor < length and normalized[cursor] in node:
+                node = node[normalized[cursor]]
+                cursor += 1
+                if "" in node and _is_boundary(normalized, cursor):
+                    accepted = (node[""], cursor)
+            if accepted is None:
+                return None
+            token, pos = accepted
+            if token[0] != _TOK_FILLER:
+                tokens.append(token)
+        return tokens
+
+    @classmethod
+    def _parse_vn_phrase(cls, text: Optional[str], base_dt: datetime) -> Optional[datetime]:
+        """Resolve a phrase fully recognised by _vn_time_dfa into a datetime"""
+        tokens = cls._vn_time_dfa(text)
+        if not tokens:
+            return None
+        found: Dict[str, List[object]] = {}
+        for kind, value in tokens:
+            found.setdefault(kind, []).append(value)
+        days = found.get(_TOK_RELATIVE_DAY, [])
+        weekdays = found.get(_TOK_WEEKDAY, [])
+        weeks = found.get(_TOK_WEEK, [])
+        clocks = found.get(_TOK_CLOCK, [])
+        parts = found.get(_TOK_PART_OF_DAY, [])
+        # Without a clock the day alone is left to the fallback chain
+        # ("hôm nay" -> now, "tối nay" -> ask for a time)
+        if len(days) + len(weekdays) != 1 or len(clocks) != 1 or len(parts) > 1:
+            return None
+        if weeks and (not weekdays or len(weeks) > 1):
+            return None
+
+        if days:
+            target = _start_of_day(base_dt, days[0])
+        else:
+            days_ahead = cls._days_until_weekday(weekdays[0], weeks[0] if weeks else "", base_dt)
+            target = _start_of_day(base_dt, days_ahead)
+
+        hour, minute = clocks[0]
+        hour = cls._adjust_hour_for_suffix(hour, parts[0] if parts else "")
+        return target.replace(hour=hour, minute=minute)
+
     @staticmethod
     def _search_datetime_in_text(text: str, base_dt: datetime) -> Optional[Tuple[datetime, str]]:
         try:
-            matches = search_dates(
-                text,
-                languages=["vi", "en"],
-                settings={
-                    "PREFER_DATES_FROM": "future",
-                    "RELATIVE_BASE": base_dt,
-                },
-            )
+            matches = _search_dates_cached(text, base_dt.replace(second=0, microsecond=0))
             if matches:
                 phrase, dt = matches[0]
                 return dt, phrase
@@ -111,26 +552,18 @@ class ScheduleService:
         return None
 
     @staticmethod
-    def _parse_single_candidate(value, base_dt: Optional[datetime] = None) -> Optional[datetime]:
-        if base_dt is None:
-            base_dt = datetime.now()
+    def _parse_single_candidate(value, base_dt: datetime) -> Optional[datetime]:
         if isinstance(value, datetime):
             return value
         if isinstance(value, str):
-            try:
-                cleaned = value.replace("Z", "+00:00") if value.endswith("Z") else value
-                return datetime.fromisoformat(cleaned)
-            except ValueError:
-                pass
-
-            parsed = dateparser.parse(
-                value,
-                languages=["vi", "en"],
-                settings={
-                    "PREFER_DATES_FROM": "future",
-                    "RELATIVE_BASE": base_dt,
-                },
-            )
+            iso_dt = _parse_iso(value)
+            if iso_dt:
+                return iso_dt
+
+            if not _HAS_DIGIT.search(value) and value.strip().lower() not in _RELATIVE_WORDS:
+                return None
+
+            parsed = _dateparser_parse_cached(value, base_dt.replace(second=0, microsecond=0))
             if parsed:
                 return parsed
         return None
@@ -139,66 +572,19 @@ class ScheduleService:
     def _extract_time_from_text(text: Optional[str]) -> Optional[Tuple[int, int, Optional[str]]]:
         if not text:
             return None
-        lowered = text.lower()
-        
-        # Pattern cho "rưỡi" trước (ưu tiên cao hơn)
-        pattern_ruoi = re.compile(
-            r'(\d{1,2})\s*(?:giờ|g|h)?\s*(rưỡi|ruoi)',
-            flags=re.UNICODE
-        )
-        for match in pattern_ruoi.finditer(lowered):
-            hour = int(match.group(1))
-            if hour > 23:
-                continue
-            return hour, 30, None
-        
-        # Pattern cho giờ đầy đủ: "7 giờ sáng", "5 giờ 30 chiều", "17h30"
-        pattern_full = re.compile(
-            r'(\d{1,2})\s*(?:[:h]|giờ|g)\s*(\d{1,2})?\s*(?:phút)?\s*(sáng|chiều|tối|trưa|am|pm)?',
-            flags=re.UNICODE
-        )
-        for match in pattern_full.finditer(lowered):
-            hour = int(match.group(1))
-            minute = int(match.group(2)) if match.group(2) else 0
-            suffix = match.group(3)
-            if hour > 23 or minute > 59:
-                continue
-            # Nếu có suffix (sáng/chiều/tối/trưa/am/pm) thì luôn trả về
-            if suffix:
-                return hour, minute, suffix
-            # Nếu không có suffix nhưng hour >= 12, có thể là 24h format
-            if hour >= 12:
-                return hour, minute, None
-            # Nếu hour < 12 và không có suffix, cần kiểm tra context
-            # Nhưng để đơn giản, nếu không có suffix và hour < 12 thì skip
-            # (sẽ được xử lý bởi logic khác)
-        return None
+        return _time_hint_from_text(text)
 
     @staticmethod
     def _normalize_text(text: Optional[str]) -> str:
         if not text:
             return ""
-        normalized = unicodedata.normalize("NFKD", text)
-        return "".join(ch for ch in normalized if not unicodedata.combining(ch)).lower()
+        return _fold_text(text)
 
-    @classmethod
-    def _weekday_to_int(cls, token: str) -> Optional[int]:
-        normalized = cls._normalize_text(token)
-        normalized = " ".join(normalized.split())
-        if normalized in ("chu nhat", "chunhat", "cn"):
-            return 6
-        if normalized.startswith("thu"):
-            remainder = normalized.replace("thu", "", 1).strip()
-            mapping = {
-                "hai": 0, "2": 0,
-                "ba": 1, "3": 1,
-                "tu": 2, "bon": 2, "4": 2,
-                "nam": 3, "5": 3,
-                "sau": 4, "6": 4,
-                "bay": 5, "7": 5,
-            }
-            return mapping.get(remainder)
-        return None
+    @staticmethod
+    def _weekday_to_int(token: Optional[str]) -> Optional[int]:
+        if not token:
+            return None
+        return _weekday_from_token(token)
 
     @staticmethod
     def _parse_relative_date(text: Optional[str], base_dt: datetime) -> Optional[datetime]:
@@ -208,84 +594,89 @@ class ScheduleService:
         normalized = ScheduleService._normalize_text(text)
         days_offset = None
         
-        # Sử dụng regex để match chính xác hơn, tránh match nhầm
-        if re.search(r'\b(ngay\s+)?mai\b', normalized):
+        # Một regex cho cả mai/mốt/kia; "mai" ở bất kỳ vị trí nào vẫn được ưu tiên
+        words = {match.group(1) for match in _PAT_REL_DATE.finditer(normalized)}
+        if "mai" in words:
             days_offset = 1
-        elif re.search(r'\bngay\s+mot\b', normalized) or re.search(r'\bmot\b', normalized):
-            days_offset = 2
-        elif re.search(r'\b(ngay\s+)?kia\b', normalized):
+        elif words:
             days_offset = 2
         
         if days_offset is not None:
-            target_date = (base_dt + timedelta(days=days_offset)).date()
-            return datetime.combine(target_date, datetime.min.time())
+            return _start_of_day(base_dt, days_offset)
         return None
 
+    @staticmethod
+    def _days_until_weekday(weekday: int, modifier_norm: str, base_dt: datetime) -> int:
+        days_ahead = (weekday - base_dt.weekday()) % 7
+        if "sau" in modifier_norm or "toi" in modifier_norm:
+            days_ahead = days_ahead + 7 if days_ahead else 7
+        elif "nay" in modifier_norm:
+            if days_ahead < 0:
+                days_ahead += 7
+        else:
+            if days_ahead == 0:
+                days_ahead = 7
+        return days_ahead
+
     @classmethod
     def _parse_relative_weekday(cls, text: Optional[str], base_dt: datetime) -> Optional[datetime]:
         if not text:
             return None
-        for match in cls.WEEKDAY_PATTERN.finditer(text.lower()):
-            weekday_token = match.group(1)
-            modifier = match.group(2) or ""
-            weekday = cls._weekday_to_int(weekday_token)
-            if weekday is None:
-                continue
-            days_ahead = (weekday - base_dt.weekday()) % 7
-            modifier_norm = cls._normalize_text(modifier)
-            if "sau" in modifier_norm or "toi" in modifier_norm:
-                days_ahead = days_ahead + 7 if days_ahead else 7
-            elif "nay" in modifier_norm:
-                if days_ahead < 0:
-                    days_ahead += 7
-            else:
-                if days_ahead == 0:
-                    days_ahead = 7
-            target_date = (base_dt + timedelta(days=days_ahead)).date()
-            return datetime.combine(target_date, datetime.min.time())
-        return None
+        # Every token WEEKDAY_PATTERN can match is in _WEEKDAY_MAP, so the first match decides
+        match = cls.WEEKDAY_PATTERN.search(text.lower())
+        if not match:
+            return None
+        weekday = cls._weekday_to_int(match.group(1))
+        if weekday is None:
+            return None
+        days_ahead = cls._days_until_weekday(weekday, cls._normalize_text(match.group(2) or ""), base_dt)
+        return _start_of_day(base_dt, days_ahead)
+
+    @staticmethod
+    def _adjust_hour_for_suffix(hour: int, suffix_norm: str) -> int:
+        """Apply a normalized part-of-day suffix (sang/trua/chieu/toi/am/pm) to an hour"""
+        if suffix_norm in ("chieu", "toi", "pm") and hour < 12:
+            return hour + 12
+        if suffix_norm in ("sang", "am"):
+            # Giữ nguyên hour nếu < 12 (đã đúng)
+            return 0 if hour == 12 else hour
+        if suffix_norm == "trua":
+            return 12 if hour == 0 else hour
+        return hour
 
     @classmethod
     def _apply_time_hint(cls, dt: datetime, text: Optional[str]) -> datetime:
         if not text:
             return dt
 
-        normalized_full = cls._normalize_text(text)
-
         hint = cls._extract_time_from_text(text)
         if hint:
             hour, minute, suffix = hint
-            suffix_norm = cls._normalize_text(suffix) if suffix else ""
             
             # Xử lý suffix trực tiếp từ regex match
-            if suffix_norm:
-                if suffix_norm in ("chieu", "toi", "pm") and hour < 12:
-                    hour += 12
-                elif suffix_norm in ("sang", "am"):
-                    if hour == 12:
-                        hour = 0
-                    # Giữ nguyên hour nếu < 12 (đã đúng)
-                elif suffix_norm == "trua":
-                    hour = 12 if hour == 0 else hour
+            if suffix:
+                hour = cls._adjust_hour_for_suffix(hour, _SUFFIX_NORM[suffix])
             else:
                 # Không có suffix trong match, kiểm tra toàn bộ text
-                if "chieu" in normalized_full or "toi" in normalized_full or "pm" in normalized_full:
+                day_parts = _scan_day_parts(cls._normalize_text(text))
+                if day_parts & _EVENING_WORDS:
                     if hour < 12:
                         hour += 12
-                elif "sang" in normalized_full or "am" in normalized_full:
+                elif day_parts & _MORNING_WORDS:
                     if hour >= 12:
                         hour -= 12
-                elif "trua" in normalized_full:
+                elif "trua" in day_parts:
                     hour = 12 if hour == 0 else hour
             
             return dt.replace(hour=hour, minute=minute, second=0, microsecond=0)
 
         # Fallback: không tìm thấy giờ cụ thể, chỉ điều chỉnh dựa trên text
-        if ("chieu" in normalized_full or "toi" in normalized_full or "pm" in normalized_full) and dt.hour < 12:
+        day_parts = _scan_day_parts(cls._normalize_text(text))
+        if day_parts & _EVENING_WORDS and dt.hour < 12:
             return dt + timedelta(hours=12)
-        if ("sang" in normalized_full or "am" in normalized_full) and dt.hour >= 12:
+        if day_parts & _MORNING_WORDS and dt.hour >= 12:
             return dt - timedelta(hours=12)
-        if "trua" in normalized_full and dt.hour < 12:
+        if "trua" in day_parts and dt.hour < 12:
             return dt.replace(hour=12, minute=0, second=0, microsecond=0)
         return dt
 
@@ -298,39 +689,61 @@ class ScheduleService:
             }
         return {"user_id": None, "user_name": "Khách chưa đăng nhập"}
 
-    def _sync_admin_calendar(self):
+    def _sync_admin_calendar(self, event: Optional[Dict] = None, deleted_id: Optional[str] = None):
+        """Patch the cached calendar and request a rewrite (debounced, runs in the background)"""
+        with self._calendar_lock:
+            if self._calendar_cache is not None:
+                if deleted_id:
+                    self._calendar_cache.pop(deleted_id, None)
+                elif event and event.get("id"):
+                    self._calendar_cache[event["id"]] = dict(event)
+        _request_calendar_sync(self)
+
+    def sync_admin_calendar_event(self, event: Dict):
+        """Patch an event updated outside this service (e.g. sale assignment) into the admin calendar"""
+        self._sync_admin_calendar(event=event)
+
+    def _calendar_snapshot(self) -> List[Dict]:
+        """Cached calendar events ordered like repo.list(); reloads when stale"""
+        with self._calendar_lock:
+            stale = _time.monotonic() - self._calendar_loaded_at > ADMIN_CALENDAR_RELOAD_INTERVAL
+            if self._calendar_cache is None or stale:
+                self._calendar_cache = {event["id"]: event for event in self.repo.list() if event.get("id")}
+                self._calendar_loaded_at = _time.monotonic()
+            events = list(self._calendar_cache.values())
+        events.sort(key=lambda item: str(item.get("requested_time") or ""))
+        return events
+
+    def _write_admin_calendar(self):
         try:
-            events = self.repo.list()
-            # Ensure all datetime fields are serialized to strings
-            serializable_events = []
-            for event in events:
-                serializable_event = {}
-                for key, value in event.items():
-                    if isinstance(value, datetime):
-                        serializable_event[key] = value.isoformat()
-                    else:
-                        serializable_event[key] = value
-                serializable_events.append(serializable_event)
+            events = self._calendar_snapshot()
             
-            with open(config.ADMIN_CALENDAR_FILE, "w", encoding="utf-8") as fh:
-                json.dump(serializable_events, fh, ensure_ascii=False, indent=2)
+            # Write to a temp file and swap it in, so readers never see a partial file
+            tmp_path = f"{config.ADMIN_CALENDAR_FILE}.tmp"
+            if HAS_ORJSON:
+                with open(tmp_path, "wb") as fh:
+                    # orjson writes datetimes as isoformat() natively
+                    fh.write(orjson.dumps(
+                        events,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    ))
+            else:
+                with open(tmp_path, "w", encoding="utf-8") as fh:
+                    json.dump(events, fh, ensure_ascii=False, indent=2, default=_isoformat_default)
+            os.replace(tmp_path, config.ADMIN_CALENDAR_FILE)
         except Exception as exc:
             logger.warning(f"Không thể đồng bộ calendar admin: {exc}", exc_info=True)
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def _extract_user_messages_from_context(context: str) -> str:
         """Extract only user messages from formatted context (User: ... Assistant: ...)"""
         if not context:
             return ""
         
-        user_messages = []
-        for line in context.split('\n'):
-            line = line.strip()
-            if line.startswith('User:') or line.startswith('user:'):
-                # Extract message after "User:"
-                msg = line.split(':', 1)[1].strip() if ':' in line else line
-                if msg:
-                    user_messages.append(msg)
+        # Extract message after "User:" on every line in one regex pass
+        user_messages = [msg.strip() for msg in _PAT_USER_LINE.findall(context)]
+        user_messages = [msg for msg in user_messages if msg]
         
         # Nếu không có format "User:", trả về toàn bộ context
         return ' '.join(user_messages) if user_messages else context
@@ -343,8 +756,7 @@ class ScheduleService:
         
         normalized = ScheduleService._normalize_text(text)
         # Pattern để tìm "quận X", "quan X", "q.X", etc.
-        pattern = re.compile(r'quan\s*(\d+)', flags=re.UNICODE)
-        match = pattern.search(normalized)
+        match = _PAT_QUAN.search(normalized)
         if match:
             return f"Quận {match.group(1)}"
         return None
@@ -354,66 +766,75 @@ class ScheduleService:
         """Get district from listing data in Qdrant by listing_id."""
         if not listing_id:
             return None
-        
+
         try:
-            must_filters = [
-                models.FieldCondition(
-                    key="ma_can",
-                    match=models.MatchValue(value=listing_id)
-                )
-            ]
-            
-            results = qdrant_service.client.scroll(
-                collection_name=qdrant_service.collection_name,
-                scroll_filter=models.Filter(must=must_filters),
-                limit=1
-            )
-            
-            points, _ = results
-            if points and points[0].payload:
-                listing_details = points[0].payload
+            # Same cached payload lookup book_appointment just made
+            listing_details = qdrant_service.get_listing_payload(listing_id)
+            if listing_details:
                 # Use centralized utility to extract district
-                district = extract_district_from_listing(listing_details)
-                return district
+                return extract_district_from_listing(listing_details)
         except Exception as e:
             logger.warning(f"Error fetching district from listing_id '{listing_id}': {e}")
         
         return None
 
-    def _validate_booking_info(self, payload: Dict, raw_message: str, context: Optional[str] = None) -> Tuple[Optional[datetime], Optional[str], Optional[str], List[str]]:
+    def _scan_message(
+        self,
+        text: str,
+        payload: Optional[Dict] = None,
+        *,
+        need_time: bool = True,
+        need_district: bool = True,
+    ) -> Tuple[Optional[datetime], Optional[str], str]:
+        """
+        Extract visit time and district from one message in one call.
+        Returns: (visit_datetime, district, source_time)
+        """
+        visit_datetime, source_time = (
+            self._parse_datetime(payload or {}, fallback_text=text) if need_time else (None, "")
+        )
+        district = self._extract_district_from_text(text) if need_district else None
+        return visit_datetime, district, source_time
+
+    def _validate_booking_info(
+        self,
+        payload: Dict,
+        raw_message: str,
+        context: Optional[str] = None,
+        parsed_time: Optional[Tuple[Optional[datetime], str]] = None,
+    ) -> Tuple[Optional[datetime], Optional[str], Optional[str], List[str]]:
         """
         Validate booking information and return missing fields.
         Combines information from current message and conversation context.
+        parsed_time: (datetime, source) already parsed from payload/raw_message, if any.
         Returns: (visit_datetime, district, source_time, missing_fields)
         """
         missing_fields = []
         
         # Ưu tiên parse từ tin nhắn hiện tại trước
-        visit_datetime, source_time = self._parse_datetime(payload, fallback_text=raw_message)
+        district = payload.get("district") or payload.get("location")
+        visit_datetime, text_district, source_time = self._scan_message(
+            raw_message, payload, need_time=parsed_time is None, need_district=not district
+        )
+        if parsed_time is not None:
+            visit_datetime, source_time = parsed_time
+        district = district or text_district
         
-        # Nếu không có trong tin nhắn hiện tại, thử từ context (chỉ user messages)
-        if not visit_datetime and context:
+        # Nếu thiếu thông tin trong tin nhắn hiện tại, thử từ context (chỉ user messages)
+        if (not visit_datetime or not district) and context:
             user_context = self._extract_user_messages_from_context(context)
             if user_context:
-                context_dt, context_source = self._parse_datetime({}, fallback_text=user_context)
+                context_dt, context_district, context_source = self._scan_message(
+                    user_context, need_time=not visit_datetime, need_district=not district
+                )
                 if context_dt:
                     visit_datetime = context_dt
                     source_time = context_source or source_time
+                district = district or context_district
         
         if not visit_datetime:
             missing_fields.append("thời gian")
         
-        # Ưu tiên extract district từ tin nhắn hiện tại trước
-        district = payload.get("district") or payload.get("location")
-        if not district:
-            district = self._extract_district_from_text(raw_message)
-        
-        # Nếu không có trong tin nhắn hiện tại, thử từ context (chỉ user messages)
-        if not district and context:
-            user_context = self._extract_user_messages_from_context(context)
-            if user_context:
-                district = self._extract_district_from_text(user_context)
-        
         # Nếu vẫn chưa có district nhưng có listing_id, tự động lấy từ listing data
         if not district and payload.get("listing_id"):
             listing_id = payload.get("listing_id")
@@ -431,6 +852,21 @@ class ScheduleService:
         return visit_datetime, district, source_time, missing_fields
 
     # ------------------ Public API ------------------ #
+    def get_user(self, user_id: str):
+        """
+        User record by id, reused for USER_CACHE_TTL seconds.
+        Only found users are cached, so a new account is visible immediately.
+        """
+        cached = self._user_cache.get(user_id)
+        if cached and _time.monotonic() - cached[0] < USER_CACHE_TTL:
+            return cached[1]
+        user = self._get_user_repo().get_user_by_id(user_id)
+        if user:
+            if len(self._user_cache) >= _USER_CACHE_MAX:
+                self._user_cache.clear()
+            self._user_cache[user_id] = (_time.monotonic(), user)
+        return user
+
     def create_booking(
         self,
         *,
@@ -439,22 +875,25 @@ class ScheduleService:
         raw_message: str,
         session_id: Optional[str] = None,
         context: Optional[str] = None,
+        parsed_time: Optional[Tuple[Optional[datetime], str]] = None,
     ) -> Dict:
         # Try to get real user_id from chat session if available AND user_session is still guest
         # If user_session already has a real user_id (from booking_tools), don't override it
+        # User record fetched below is reused for the email lookup
+        resolved_user = None
         if session_id and user_session and user_session.user_id.startswith("guest_"):
             try:
                 from ..services.chat_service import chat_service
                 chat_session = chat_service.get_session(session_id)
-                logger.debug(f"Chat session for booking: session_id={session_id}, user_id={chat_session.get('user_id') if chat_session else None}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Chat session for booking: session_id={session_id}, user_id={chat_session.get('user_id') if chat_session else None}")
                 if chat_session and chat_session.get("user_id"):
                     real_user_id = chat_session.get("user_id")
                     # If we found a real user_id (not guest), create proper user_session
                     if real_user_id and not real_user_id.startswith("guest_"):
-                        from ..repositories.user_repository import UserRepository
-                        user_repo = UserRepository()
-                        user = user_repo.get_user_by_id(real_user_id)
+                        user = self.get_user(real_user_id)
                         if user:
+                            resolved_user = user
                             # Create proper user_session with real user data
                             from ..schemas.user import UserRole, UserStatus
                             user_session = UserSession(
@@ -474,7 +913,9 @@ class ScheduleService:
                 logger.warning(f"Could not get user_id from chat session: {e}", exc_info=True)
         elif user_session and not user_session.user_id.startswith("guest_"):
             logger.info(f"User session already has real user_id: {user_session.user_id}, skipping chat session lookup")
-        visit_datetime, district, source_time, missing_fields = self._validate_booking_info(payload, raw_message, context)
+        visit_datetime, district, source_time, missing_fields = self._validate_booking_info(
+            payload, raw_message, context, parsed_time=parsed_time
+        )
         
         # Nếu thiếu thông tin, raise ValidationError với message hỏi lại
         if missing_fields:
@@ -510,9 +951,10 @@ class ScheduleService:
         if not user_email and user_session and not user_session.user_id.startswith("guest_"):
             # User is logged in, get email from user record
             try:
-                from ..repositories.user_repository import UserRepository
-                user_repo = UserRepository()
-                user = user_repo.get_user_by_id(user_session.user_id)
+                if resolved_user and resolved_user.id == user_session.user_id:
+                    user = resolved_user
+                else:
+                    user = self.get_user(user_session.user_id)
                 if user:
                     user_email = user.email
                     logger.info(f"Retrieved email from user record: {user_email}")
@@ -522,6 +964,8 @@ class ScheduleService:
         # Get phone from payload (stored separately, not in notes)
         user_phone = payload.get("phone", "")
         
+        # Naive UTC, same format as the repository's updated_at timestamps
+        now_iso = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
         base_event = {
             "id": str(uuid.uuid4()),
             "user_id": final_user_id,
@@ -534,8 +978,8 @@ class ScheduleService:
             "notes": payload.get("notes") or payload.get("requirements") or "",  # Notes only for customer notes/requirements
             "status": "pending",
             "requested_time": visit_datetime.isoformat(),
-            "created_at": datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat(),
+            "created_at": now_iso,
+            "updated_at": now_iso,
             "source_time_text": source_time,
             "raw_message": raw_message,
             "session_id": session_id,
@@ -560,7 +1004,7 @@ class ScheduleService:
                 logger.error(f"Event {event['id']} was created but cannot be retrieved from database")
                 raise DatabaseConnectionError("Lịch hẹn đã được tạo nhưng không thể truy vấn lại. Vui lòng kiểm tra database.")
             
-            self._sync_admin_calendar()
+            self._sync_admin_calendar(event=retrieved_event)
             logger.info(f"Tạo lịch xem nhà thành công: event_id={event['id']}, user_id={event.get('user_id')}, listing_id={event.get('listing_id')}")
             return event
         except DatabaseConnectionError:
@@ -569,6 +1013,45 @@ class ScheduleService:
             logger.error(f"Create schedule failed: {exc}", exc_info=True)
             raise DatabaseConnectionError("Không thể lưu lịch hẹn, vui lòng thử lại sau.")
 
+    def create_bookings_bulk(
+        self,
+        *,
+        user_session: Optional[UserSession],
+        payloads: List[Dict],
+        raw_messages: List[str],
+    ) -> Dict:
+        """
+        Create many bookings at once (admin import).
+        Time expressions are parsed once per distinct (payload time fields, message)
+        and reused across rows. Rows that fail validation are reported, not raised.
+        Returns: {"created": [event, ...], "errors": [{"index": i, "error": str}, ...]}
+        """
+        if len(payloads) != len(raw_messages):
+            raise ValidationError("Số lượng payload và tin nhắn không khớp.")
+
+        parsed_times: Dict[Tuple, Tuple[Optional[datetime], str]] = {}
+        created: List[Dict] = []
+        errors: List[Dict] = []
+        for index, (payload, raw_message) in enumerate(zip(payloads, raw_messages)):
+            key = (tuple(str(payload.get(k) or "") for k in _CANDIDATE_KEYS), raw_message or "")
+            if key not in parsed_times:
+                parsed_times[key] = self._parse_datetime(payload, fallback_text=raw_message)
+            try:
+                created.append(self.create_booking(
+                    user_session=user_session,
+                    payload=payload,
+                    raw_message=raw_message,
+                    parsed_time=parsed_times[key],
+                ))
+            except (ValidationError, DatabaseConnectionError) as exc:
+                errors.append({"index": index, "error": str(exc)})
+
+        logger.info(
+            f"Bulk booking import: {len(created)} created, {len(errors)} failed, "
+            f"{len(parsed_times)} distinct time expressions parsed"
+        )
+        return {"created": created, "errors": errors}
+
     def format_confirmation(self, event: Dict) -> str:
         visit_time = event.get("requested_time")
         try:
@@ -598,7 +1081,8 @@ class ScheduleService:
     def list_all(self) -> List[Dict]:
         events = self.repo.list()
         logger.info(f"Loaded {len(events)} events from database for list_all()")
-        if events:
+        # Debug is off in production; don't build the sample list for nothing
+        if events and logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Sample event IDs: {[e.get('id') for e in events[:3]]}")
         return events
 
@@ -608,7 +1092,7 @@ class ScheduleService:
     def update_status(self, schedule_id: str, status: str, admin_note: Optional[str] = None) -> Optional[Dict]:
         updated = self.repo.update_status(schedule_id, status, admin_note)
         if updated:
-            self._sync_admin_calendar()
+            self._sync_admin_calendar(event=updated)
         return updated
 
     def delete(self, schedule_id: str, current_user: Optional[UserSession] = None) -> bool:
@@ -619,7 +1103,7 @@ class ScheduleService:
         
         result = self.repo.delete(schedule_id)
         if result:
-            self._sync_admin_calendar()
+            self._sync_admin_calendar(deleted_id=schedule_id)
         return result
 
 
@@ -2,110 +2,137 @@
 Slot Validation Service
 Responsible for validating extracted slots against business rules and constraints.
 """
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from ..core import settings
 from ..core.logger import logger
 
-class SlotValidator:
-    """Validator for NLU slots"""
+_PRICE_NEGATIVE = "Giá bán không thể là số âm."
+_PRICE_MIN_GT_MAX = "Giá tối thiểu không thể lớn hơn giá tối đa."
+_PRICE_TOO_LOW = "Giá bán có vẻ quá thấp (dưới {} triệu)."
+_PRICE_TOO_HIGH = "Giá bán có vẻ quá cao (trên {} tỷ)."
+_BEDROOMS_BELOW_MIN = "Số phòng ngủ tối thiểu là {}."
+_BEDROOMS_ABOVE_MAX = "Số phòng ngủ tối đa là {}."
+_AREA_TOO_SMALL = "Diện tích có vẻ quá nhỏ (dưới {}m2)."
+_AREA_TOO_LARGE = "Diện tích có vẻ quá lớn (trên {}m2)."
 
-    def validate_slots(self, slots: Dict[str, Any]) -> List[str]:
-        """
-        Validate all slots.
-        Returns a list of error messages (empty if valid).
-        """
-        errors = []
-        
-        # Validate Price
-        if slots.get("gia_ban"):
-            price_error = self.validate_price(slots["gia_ban"])
-            if price_error:
-                errors.append(price_error)
-
-        # Validate Bedrooms
-        if slots.get("so_phong_ngu"):
-            bedroom_error = self.validate_bedrooms(slots["so_phong_ngu"])
-            if bedroom_error:
-                errors.append(bedroom_error)
-
-        # Validate Area
-        if slots.get("dien_tich"):
-            area_error = self.validate_area(slots["dien_tich"])
-            if area_error:
-                errors.append(area_error)
 
-        return errors
+@lru_cache(maxsize=64)
+def _bound_message(template: str, bound: Any, scale: Optional[int] = None) -> str:
+    """Error text for the bound actually checked; formatted once per (template, bound)"""
+    return template.format(bound / scale if scale else bound)
+
 
-    def validate_price(self, price: Any) -> Optional[str]:
-        """Validate price range or value"""
+def validate_price(price: Any) -> Optional[str]:
+    """Validate price range or value"""
+    # Scalars are the common case; exact type checks first, subclasses (bool) after dict
+    price_type = type(price)
+    if price_type is int or price_type is float or (
+        price_type is not dict and isinstance(price, (int, float))
+    ):
+        # One chained comparison for a valid price
+        if settings.MIN_VALID_PRICE <= price <= settings.MAX_VALID_PRICE:
+            return None
+        if price < 0:
+            return _PRICE_NEGATIVE
+        if price < settings.MIN_VALID_PRICE:
+            return _bound_message(_PRICE_TOO_LOW, settings.MIN_VALID_PRICE, 1_000_000)
+        if price > settings.MAX_VALID_PRICE:
+            return _bound_message(_PRICE_TOO_HIGH, settings.MAX_VALID_PRICE, 1_000_000_000)
+        return None
+
+    if isinstance(price, dict):
+        # Only range bounds of mixed/odd types can fail here
         try:
-            if isinstance(price, dict):
-                min_p = price.get("min", 0)
-                max_p = price.get("max", float("inf"))
-                
-                if min_p < 0 or max_p < 0:
-                    return "Giá bán không thể là số âm."
-                if min_p > max_p:
-                    return "Giá tối thiểu không thể lớn hơn giá tối đa."
-                
-                # Check reasonable limits (e.g. < 100 million or > 100 billion)
-                # But be careful with "thue" vs "ban". Assuming "ban" for now.
-                if max_p < settings.MIN_VALID_PRICE and max_p != float("inf"):
-                     return f"Giá bán có vẻ quá thấp (dưới {settings.MIN_VALID_PRICE/1_000_000} triệu)."
-                
-            elif isinstance(price, (int, float)):
-                if price < 0:
-                    return "Giá bán không thể là số âm."
-                if price < settings.MIN_VALID_PRICE:
-                    return f"Giá bán có vẻ quá thấp (dưới {settings.MIN_VALID_PRICE/1_000_000} triệu)."
-                if price > settings.MAX_VALID_PRICE:
-                    return f"Giá bán có vẻ quá cao (trên {settings.MAX_VALID_PRICE/1_000_000_000} tỷ)."
-                    
-        except Exception as e:
+            min_p = price.get("min", 0)
+            max_p = price.get("max", float("inf"))
+            
+            if min_p < 0 or max_p < 0:
+                return _PRICE_NEGATIVE
+            if min_p > max_p:
+                return _PRICE_MIN_GT_MAX
+            
+            # Check reasonable limits (e.g. < 100 million or > 100 billion)
+            # But be careful with "thue" vs "ban". Assuming "ban" for now.
+            if max_p < settings.MIN_VALID_PRICE and max_p != float("inf"):
+                 return _bound_message(_PRICE_TOO_LOW, settings.MIN_VALID_PRICE, 1_000_000)
+        except TypeError as e:
             logger.error(f"Error validating price: {e}")
             return "Giá bán không hợp lệ."
             
-        return None
+    return None
 
-    def validate_bedrooms(self, bedrooms: Any) -> Optional[str]:
-        """Validate number of bedrooms"""
-        try:
-            if isinstance(bedrooms, dict):
-                min_b = bedrooms.get("min", 0)
-                max_b = bedrooms.get("max", 10)
-                if min_b < 0 or max_b < 0:
-                    return "Số phòng ngủ không thể âm."
-                if min_b > max_b:
-                    return "Số phòng ngủ tối thiểu không thể lớn hơn tối đa."
-            else:
-                val = int(bedrooms)
-                if val < settings.MIN_BEDROOMS:
-                    return f"Số phòng ngủ tối thiểu là {settings.MIN_BEDROOMS}."
-                if val > settings.MAX_BEDROOMS:
-                    return f"Số phòng ngủ tối đa là {settings.MAX_BEDROOMS}."
-        except ValueError:
-            return "Số phòng ngủ phải là số."
-        return None
 
-    def validate_area(self, area: Any) -> Optional[str]:
-        """Validate area"""
-        try:
-            if isinstance(area, dict):
-                min_a = area.get("min", 0)
-                max_a = area.get("max", float("inf"))
-                if min_a < 0:
-                    return "Diện tích không thể âm."
-                if min_a > max_a:
-                    return "Diện tích tối thiểu không thể lớn hơn tối đa."
-            else:
-                val = float(area)
-                if val < settings.MIN_AREA:
-                    return f"Diện tích có vẻ quá nhỏ (dưới {settings.MIN_AREA}m2)."
-                if val > settings.MAX_AREA:
-                    return f"Diện tích có vẻ quá lớn (trên {settings.MAX_AREA}m2)."
-        except ValueError:
-            return "Diện tích phải là số."
-        return None
+def validate_bedrooms(bedrooms: Any) -> Optional[str]:
+    """Validate number of bedrooms"""
+    try:
+        if isinstance(bedrooms, dict):
+            min_b = bedrooms.get("min", 0)
+            max_b = bedrooms.get("max", 10)
+            if min_b < 0 or max_b < 0:
+                return "Số phòng ngủ không thể âm."
+            if min_b > max_b:
+                return "Số phòng ngủ tối thiểu không thể lớn hơn tối đa."
+        else:
+            # Ints (the usual NLU output) skip the conversion
+            val = bedrooms if isinstance(bedrooms, int) else int(bedrooms)
+            if val < settings.MIN_BEDROOMS:
+                return _bound_message(_BEDROOMS_BELOW_MIN, settings.MIN_BEDROOMS)
+            if val > settings.MAX_BEDROOMS:
+                return _bound_message(_BEDROOMS_ABOVE_MAX, settings.MAX_BEDROOMS)
+    except ValueError:
+        return "Số phòng ngủ phải là số."
+    return None
+
+
+def validate_area(area: Any) -> Optional[str]:
+    """Validate area"""
+    try:
+        if isinstance(area, dict):
+            min_a = area.get("min", 0)
+            max_a = area.get("max", float("inf"))
+            if min_a < 0:
+                return "Diện tích không thể âm."
+            if min_a > max_a:
+                return "Diện tích tối thiểu không thể lớn hơn tối đa."
+        else:
+            val = area if isinstance(area, (int, float)) else float(area)
+            if val < settings.MIN_AREA:
+                return _bound_message(_AREA_TOO_SMALL, settings.MIN_AREA)
+            if val > settings.MAX_AREA:
+                return _bound_message(_AREA_TOO_LARGE, settings.MAX_AREA)
+    except ValueError:
+        return "Diện tích phải là số."
+    return None
+
+
+# Slot key -> validator, in the order errors are reported
+_VALIDATORS = {
+    "gia_ban": validate_price,
+    "so_phong_ngu": validate_bedrooms,
+    "dien_tich": validate_area,
+}
+
+
+class SlotValidator:
+    """Validator for NLU slots (stateless; the checks are module-level functions)"""
+
+    validate_price = staticmethod(validate_price)
+    validate_bedrooms = staticmethod(validate_bedrooms)
+    validate_area = staticmethod(validate_area)
+
+    def validate_slots(self, slots: Dict[str, Any]) -> List[str]:
+        """
+        Validate all slots.
+        Returns a list of error messages (empty if valid).
+        """
+        errors = []
+        get = slots.get
+        for key, check in _VALIDATORS.items():
+            value = get(key)
+            if value and (error := check(value)):
+                errors.append(error)
+        return errors
 
 # Singleton
 slot_validator = SlotValidator()
@@ -1,12 +1,36 @@
+from functools import lru_cache
 from typing import Optional
 from langchain.tools import tool
 import requests
 import os
+import uuid
 from ..core.config import config
 from ..core.logger import logger
+from ..utils.json_utils import dumps_bytes
+from ..utils.file_utils import ensure_dir
 
 from ..core.settings import DEFAULT_VOICE_ID
 
+# Shared session: keeps the TLS connection to api.elevenlabs.io alive between calls
+_ELEVEN_SESSION = requests.Session()
+_CHUNK_SIZE = 64 * 1024
+
+# Request body is fixed apart from "text": {"text":<text>,"model_id":...,"voice_settings":{...}}
+_AUDIO_BODY_PREFIX = b'{"text":'
+
+
+@lru_cache(maxsize=4)
+def _audio_body_suffix(model_id: str) -> bytes:
+    """Serialized tail of the request body, built once per model (config.AUDIO_MODEL is read per call)."""
+    return b"," + dumps_bytes({
+        "model_id": model_id,
+        "voice_settings": {
+            "stability": 0.5,
+            "similarity_boost": 0.5
+        }
+    })[1:]
+
+
 @tool
 def generate_audio_tool(text: str, voice_id: Optional[str] = None) -> str:
     """
@@ -41,32 +65,28 @@ def generate_audio_tool(text: str, voice_id: Optional[str] = None) -> str:
         "xi-api-key": api_key
     }
     
-    data = {
-        "text": text,
-        "model_id": config.AUDIO_MODEL,
-        "voice_settings": {
-            "stability": 0.5,
-            "similarity_boost": 0.5
-        }
-    }
+    # Only the text is serialized per call
+    data = _AUDIO_BODY_PREFIX + dumps_bytes(text) + _audio_body_suffix(config.AUDIO_MODEL)
     
     try:
-        response = requests.post(url, json=data, headers=headers)
-        if response.status_code == 200:
-            # Save file
-            import uuid
-            filename = f"audio_{uuid.uuid4()}.mp3"
-            save_dir = config.AUDIO_TARGET_DIR # "data/audio_generations"
-            os.makedirs(save_dir, exist_ok=True)
-            filepath = os.path.join(save_dir, filename)
-            
-            with open(filepath, "wb") as f:
-                f.write(response.content)
+        with _ELEVEN_SESSION.post(url, data=data, headers=headers, stream=True) as response:
+            if response.status_code == 200:
+                # Save file
+                filename = f"audio_{uuid.uuid4().hex}.mp3"
+                save_dir = ensure_dir(config.AUDIO_TARGET_DIR) # "data/audio_generations"
+                filepath = os.path.join(save_dir, filename)
                 
-            return f"Audio generated successfully: {filepath}"
-        else:
-            logger.error(f"ElevenLabs API Error: {response.text}")
-            return f"Error generating audio: {response.status_code} - {response.text}"
+                # Stream the MP3 to disk instead of holding the whole clip in memory
+                # O_EXCL: create-and-open in one call, never clobber an existing file
+                fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+                with os.fdopen(fd, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                        f.write(chunk)
+                    
+                return f"Audio generated successfully: {filepath}"
+            else:
+                logger.error(f"ElevenLabs API Error: {response.text}")
+                return f"Error generating audio: {response.status_code} - {response.text}"
     except Exception as e:
         logger.error(f"Exception in generate_audio_tool: {e}")
         return f"Error: {str(e)}"
@@ -1,6 +1,7 @@
-from typing import Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Optional, Dict, Tuple
 from langchain.tools import tool
-from qdrant_client.http import models
 from datetime import datetime
 
 from ..services.schedule_service import schedule_service
@@ -11,8 +12,29 @@ from ..core.logger import logger
 from ..core.exceptions import ValidationError, DatabaseConnectionError
 import json
 
-# Module-level variable to store current thread_id (set by agent)
-_current_thread_id = None
+# Current chat thread_id, set by the agent per invoke. A ContextVar keeps concurrent
+# sessions apart; LangChain's tool executor copies the context into worker threads.
+_current_thread_id: ContextVar[Optional[str]] = ContextVar("booking_thread_id", default=None)
+
+# Runs the listing lookup alongside the chat session lookup in book_appointment
+_LOOKUP_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="booking-lookup")
+
+
+def _fetch_listing_info(listing_id: str) -> Tuple[Optional[str], str]:
+    """(district, property_type) of a listing; defaults when it can't be fetched."""
+    district = None
+    property_type = "bất động sản"
+    try:
+        # Listing payload by ma_can (cached, retries hit the cache)
+        listing_details = qdrant_service.get_listing_payload(listing_id)
+        if listing_details:
+            # Use centralized utility to extract district
+            district = extract_district_from_listing(listing_details)
+            property_type = listing_details.get("loai_can") or listing_details.get("property_type") or "bất động sản"
+            logger.info(f"Extracted district '{district}' and property_type '{property_type}' from listing {listing_id}")
+    except Exception as e:
+        logger.warning(f"Could not fetch listing details for {listing_id}: {e}")
+    return district, property_type
 
 @tool
 def book_appointment(
@@ -46,65 +68,16 @@ def book_appointment(
     logger.info(f"Tool book_appointment called: listing_id={listing_id}, time={time}, session_id={session_id}")
     
     try:
-        # Try to get listing details to extract district
-        district = None
-        property_type = "bất động sản"
-        
-        try:
-            # Query Qdrant directly to get listing details
-            must_filters = [
-                models.FieldCondition(
-                    key="ma_can",
-                    match=models.MatchValue(value=listing_id)
-                )
-            ]
-            
-            results = qdrant_service.client.scroll(
-                collection_name=qdrant_service.collection_name,
-                scroll_filter=models.Filter(must=must_filters),
-                limit=1
-            )
-            
-            points, _ = results
-            if points and points[0].payload:
-                listing_details = points[0].payload
-                # Use centralized utility to extract district
-                district = extract_district_from_listing(listing_details)
-                property_type = listing_details.get("loai_can") or listing_details.get("property_type") or "bất động sản"
-                logger.info(f"Extracted district '{district}' and property_type '{property_type}' from listing {listing_id}")
-        except Exception as e:
-            logger.warning(f"Could not fetch listing details for {listing_id}: {e}")
-        
-        # Construct payload with extracted information
-        # Notes should only contain customer notes/requirements, not duplicate contact info
-        # Contact info (name, phone, email, listing_id) is already stored in separate fields
-        payload = {
-            "time_text": time,
-            "district": district or "",  # Will be extracted from raw_message if empty
-            "property_type": property_type,
-            "listing_id": listing_id,  # Add listing_id to payload
-            "user_email": email,  # Store email for sending confirmation later
-            "phone": phone,  # Store phone separately for easy access
-            "notes": ""  # Notes field is for customer notes/requirements only, not contact info
-        }
+        # Qdrant listing lookup runs while the chat session / user lookups below happen
+        listing_future = _LOOKUP_EXECUTOR.submit(_fetch_listing_info, listing_id)
         
-        # Build comprehensive raw_message with all available info
-        raw_message = f"Đặt lịch xem căn {listing_id}"
-        if customer_name:
-            raw_message += f" cho {customer_name}"
-        raw_message += f" vào {time}"
-        if district:
-            raw_message += f" tại {district}"
-        if phone:
-            raw_message += f" (SĐT: {phone})"
-        
-        # Use provided session_id, or get from module-level variable (set by agent), or generate one
-        # Priority: 1) parameter session_id, 2) module-level _current_thread_id, 3) generate new
-        global _current_thread_id
-        booking_session_id = session_id or _current_thread_id or f"booking_{listing_id}_{int(datetime.now().timestamp())}"
+        # Use provided session_id, or get from the context variable (set by agent), or generate one
+        # Priority: 1) parameter session_id, 2) _current_thread_id, 3) generate new
+        current_thread_id = _current_thread_id.get()
+        booking_session_id = session_id or current_thread_id or f"booking_{listing_id}_{int(datetime.now().timestamp())}"
         
-        if not session_id and _current_thread_id:
-            logger.info(f"Using thread_id from agent context: {_current_thread_id}")
+        if not session_id and current_thread_id:
+            logger.info(f"Using thread_id from agent context: {current_thread_id}")
         
         # Try to get real user_id from chat session FIRST, before creating guest session
         # This ensures logged-in users get their real user_id saved in the schedule
@@ -126,9 +99,8 @@ def book_appointment(
         if real_user_id:
             # User is logged in, get full user info
             try:
-                from ..repositories.user_repository import UserRepository
-                user_repo = UserRepository()
-                user = user_repo.get_user_by_id(real_user_id)
+                # Cached; create_booking looks up the same user again for the email
+                user = schedule_service.get_user(real_user_id)
                 if user:
                     user_session = UserSession(
                         user_id=user.id,
@@ -164,6 +136,32 @@ def book_appointment(
             )
             logger.info(f"Using guest session: user_id={user_session.user_id}")
         
+        district, property_type = listing_future.result()
+        
+        # Construct payload with extracted information
+        # Notes should only contain customer notes/requirements, not duplicate contact info
+        # Contact info (name, phone, email, listing_id) is already stored in separate fields
+        payload = {
+            "time_text": time,
+            "district": district or "",  # Will be extracted from raw_message if empty
+            "property_type": property_type,
+            "listing_id": listing_id,  # Add listing_id to payload
+            "user_email": email,  # Store email for sending confirmation later
+            "phone": phone,  # Store phone separately for easy access
+            "notes": ""  # Notes field is for customer notes/requirements only, not contact info
+        }
+        
+        # Build comprehensive raw_message with all available info
+        parts = [f"Đặt lịch xem căn {listing_id}"]
+        if customer_name:
+            parts.append(f" cho {customer_name}")
+        parts.append(f" vào {time}")
+        if district:
+            parts.append(f" tại {district}")
+        if phone:
+            parts.append(f" (SĐT: {phone})")
+        raw_message = "".join(parts)
+        
         try:
             event = schedule_service.create_booking(
                 user_session=user_session,
@@ -1,13 +1,42 @@
 from langchain.tools import tool
+import base64
+import hashlib
 import os
+import unicodedata
 import uuid
-import google.generativeai as genai
+import requests
 from ..core.logger import logger
 from ..core.config import config
+from ..utils.json_utils import dumps_bytes
+from ..utils.file_utils import ensure_dir
+
+# Shared session: keeps the TLS connection to the Imagen endpoint alive between calls
+_IMAGEN_SESSION = requests.Session()
+_B64_BLOCK = 64 * 1024
+IMAGE_OUTPUT_DIR = "data/generated_images"
+IMAGEN_MODEL = "imagen-4.0-generate-001"
+IMAGEN_ASPECT_RATIO = "1:1"
+
+# {"instances":[{"prompt":<prompt>}],"parameters":{...}} with everything but the prompt pre-serialized
+_IMAGEN_BODY_PREFIX = b'{"instances":[{"prompt":'
+_IMAGEN_BODY_SUFFIX = b"}]," + dumps_bytes({
+    "parameters": {
+        "sampleCount": 1,
+        "aspectRatio": IMAGEN_ASPECT_RATIO
+    }
+})[1:]
+
+
+def _prompt_image_id(prompt: str) -> str:
+    """
+    Content address for a prompt: same model, aspect ratio and prompt -> same file.
+    NFC + collapsed whitespace, so precomposed and decomposed Vietnamese
+    diacritics ("căn hộ" typed either way) share one image.
+    """
+    canonical = unicodedata.normalize("NFC", " ".join(prompt.split()))
+    key = f"{IMAGEN_MODEL}|{IMAGEN_ASPECT_RATIO}|{canonical}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
 
-# Configure GenAI with API Key
-if config.GEMINI_API_KEY:
-    genai.configure(api_key=config.GEMINI_API_KEY)
 
 @tool
 def generate_image_tool(prompt: str) -> str:
@@ -27,30 +56,24 @@ def generate_image_tool(prompt: str) -> str:
         if not config.GEMINI_API_KEY:
              return "Error: GEMINI_API_KEY is missing. Cannot generate image."
 
+        # Identical prompts reuse the image on disk instead of paying for another generation
+        image_id = _prompt_image_id(prompt)
+        file_path = f"{IMAGE_OUTPUT_DIR}/{image_id}.png"
+        if os.path.exists(file_path):
+            logger.info(f"Reusing generated image {file_path}")
+            return f"Image generated successfully: {file_path}"
+
         # Imagen 4.0 REST API endpoint (Vertex AI/Gemini API)
         # Note: Using the generativelanguage.googleapis.com endpoint
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/imagen-4.0-generate-001:predict?key={config.GEMINI_API_KEY}"
+        url = f"https://generativelanguage.googleapis.com/v1beta/models/{IMAGEN_MODEL}:predict?key={config.GEMINI_API_KEY}"
         
         headers = {
             "Content-Type": "application/json"
         }
         
-        payload = {
-            "instances": [
-                {
-                    "prompt": prompt
-                }
-            ],
-            "parameters": {
-                "sampleCount": 1,
-                "aspectRatio": "1:1"
-            }
-        }
-        
-        import requests
-        import base64
+        payload = _IMAGEN_BODY_PREFIX + dumps_bytes(prompt) + _IMAGEN_BODY_SUFFIX
         
-        response = requests.post(url, headers=headers, json=payload)
+        response = _IMAGEN_SESSION.post(url, headers=headers, data=payload)
         
         if response.status_code != 200:
             logger.error(f"Imagen API Error: {response.text}")
@@ -73,15 +96,18 @@ def generate_image_tool(prompt: str) -> str:
              return f"Error: Unexpected response format: {result.keys()}"
 
         # Create directory if it doesn't exist
-        output_dir = "data/generated_images"
-        os.makedirs(output_dir, exist_ok=True)
+        ensure_dir(IMAGE_OUTPUT_DIR)
         
-        # Save image
-        image_id = str(uuid.uuid4())
-        file_path = f"{output_dir}/{image_id}.png"
+        # Save image under a unique temp name and swap it in, so a concurrent
+        # request for the same prompt never sees a half-written file
+        tmp_path = f"{file_path}.{uuid.uuid4().hex}.tmp"
         
-        with open(file_path, "wb") as f:
-            f.write(base64.b64decode(b64_image))
+        # Decode in blocks (a multiple of 4 base64 chars) so the full PNG is never in memory twice
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        with os.fdopen(fd, "wb") as f:
+            for start in range(0, len(b64_image), _B64_BLOCK):
+                f.write(base64.b64decode(b64_image[start:start + _B64_BLOCK]))
+        os.replace(tmp_path, file_path)
             
         logger.info(f"Image saved to {file_path}")
         
@@ -83,7 +83,7 @@ def search_listings(
     # 2. Search
     # We include all criteria in the search text for Semantic Search
     search_text = f"{du_an or ''} {khu_vuc or ''} {huong or ''} {so_phong_ngu or ''} phòng ngủ"
-    vector = embedding_service.encode([search_text])[0].tolist()
+    vector = embedding_service.encode_query(search_text)
     
     results = qdrant_service.query_points(
         collection_name=qdrant_service.collection_name,
@@ -96,6 +96,8 @@ def search_listings(
     listings = []
     for point in results.points:
         listings.append(point.payload)
+    # The user usually books one of these next; book_appointment reads the cache
+    qdrant_service.cache_listing_payloads(listings)
         
     return listings
 
@@ -112,27 +114,10 @@ def get_listing_details(listing_id: str) -> Dict:
     """
     logger.info(f"Tool get_listing_details called for {listing_id}")
     
-    # We need to search by ID. 
-    # Usually ID is stored in payload 'ma_can' or point ID?
-    # Let's assume 'ma_can' in payload.
-    
-    must_filters = [
-        models.FieldCondition(
-            key="ma_can",
-            match=models.MatchValue(value=listing_id)
-        )
-    ]
-    
-    # Using scroll since we look for exact match
-    results = qdrant_service.client.scroll(
-        collection_name=qdrant_service.collection_name,
-        scroll_filter=models.Filter(must=must_filters),
-        limit=1
-    )
-    
-    points, _ = results
-    if points:
-        return points[0].payload
+    # ma_can is a keyword-indexed payload field; lookups are cached per ma_can
+    payload = qdrant_service.get_listing_payload(listing_id)
+    if payload:
+        return payload
     
     return {"error": f"Không tìm thấy căn hộ có mã {listing_id}"}
 
@@ -154,28 +139,13 @@ def compare_listings(listing_ids: List[str]) -> Dict:
     """
     logger.info(f"Tool compare_listings called for {listing_ids}")
     
+    # One batched lookup instead of a scroll per id
+    payloads = qdrant_service.get_listing_payloads(listing_ids)
+
     results = {}
-    
     for lid in listing_ids:
-        details = get_listing_details.invoke(lid) # Invoke internal logic? Or just reuse logic?
-        # Better reuse logic directly
-        # Re-implementing simplified lookup for batch
-        
-        must_filters = [
-            models.FieldCondition(
-                key="ma_can",
-                match=models.MatchValue(value=lid)
-            )
-        ]
-        points, _ = qdrant_service.client.scroll(
-            collection_name=qdrant_service.collection_name,
-            scroll_filter=models.Filter(must=must_filters),
-            limit=1
-        )
-        if points:
-            results[lid] = points[0].payload
-        else:
-            results[lid] = "Không tìm thấy"
+        payload = payloads.get(lid)
+        results[lid] = payload if payload else "Không tìm thấy"
             
     return results
 
@@ -198,7 +168,7 @@ def suggest_similar_listings(listing_id: str) -> List[Dict]:
     """
     logger.info(f"Tool suggest_similar_listings called for {listing_id}")
     
-    # 1. Get the source listing to get its vector (if plausible) or re-encode its text
+    # 1. Find the source point id (indexed ma_can filter, no vector transfer)
     must_filters = [
         models.FieldCondition(
             key="ma_can",
@@ -209,20 +179,20 @@ def suggest_similar_listings(listing_id: str) -> List[Dict]:
         collection_name=qdrant_service.collection_name,
         scroll_filter=models.Filter(must=must_filters),
         limit=1,
-        with_vectors=True
+        with_payload=False,
+        with_vectors=False
     )
     
     if not points:
         return [{"error": "Không tìm thấy căn mẫu"}]
         
     source_point = points[0]
-    source_vector = source_point.vector
     
-    # 2. Search nearest neighbors
-    # Need to exclude the source point itself
+    # 2. Search nearest neighbors server-side from the source point's stored vector
+    # (recommend excludes the positive example itself)
     results = qdrant_service.query_points(
         collection_name=qdrant_service.collection_name,
-        query=source_vector,
+        query=models.RecommendQuery(recommend=models.RecommendInput(positive=[source_point.id])),
         limit=5
     )
     
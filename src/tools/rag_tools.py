@@ -22,12 +22,13 @@ def project_info_tool(topic: str) -> str:
     logger.info(f"Tool project_info_tool called: {topic}")
     
     # 1. Vector Search
-    vector = embedding_service.encode([topic])[0].tolist()
+    vector = embedding_service.encode_query(topic)
     
     results = qdrant_service.query_points(
         collection_name=qdrant_service.collection_name,
         query=vector,
-        limit=3 
+        limit=3,
+        with_payload=["text_representation"]  # only field used below
     )
     
     if not results.points:
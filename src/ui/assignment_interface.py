@@ -1,6 +1,8 @@
 """
 Assignment Interface - Handle assignment confirmation/rejection from email links
 """
+import hashlib
+import time
 import streamlit as st
 from typing import Optional, Tuple, Dict
 
@@ -13,6 +15,20 @@ from ..schemas.user import UserRole, UserSession
 class AssignmentInterface:
     """UI for assignment confirmation/rejection"""
 
+    @staticmethod
+    def _decode_token(token: str) -> Dict:
+        """
+        Decode the assignment token once per session; the verified payload is
+        reused across reruns until its exp. Invalid tokens are never cached.
+        """
+        key = "_assignment_token_" + hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+        payload = st.session_state.get(key)
+        if payload and payload.get("exp", 0) > time.time():
+            return payload
+        payload = assignment_service.decode_assignment_token(token)
+        st.session_state[key] = payload
+        return payload
+
     def _validate_token_and_user(self, token: str, check_schedule: bool = True) -> Tuple[bool, Optional[str], Optional[str], Optional[Dict]]:
         """
         Validate token, user, and optionally check if schedule still exists.
@@ -20,7 +36,7 @@ class AssignmentInterface:
         """
         try:
             # Verify token and get sale_id
-            payload = assignment_service.decode_assignment_token(token)
+            payload = self._decode_token(token)
             sale_id_from_token = payload.get("sale_id")
             schedule_id_from_token = payload.get("schedule_id")
             
@@ -190,14 +206,14 @@ class AssignmentInterface:
             # Determine action from URL path or query params
             # Check if we're on /assignment/confirm or /assignment/reject route
             # For Streamlit, we'll use query params: ?token=xxx&action=confirm or ?token=xxx&action=reject
-            action = query_params.get("action", "").lower()
-            page = query_params.get("page", "").lower()
+            # One lowered string for both params ("|" keeps a match from spanning them)
+            route = f'{query_params.get("action", "")}|{query_params.get("page", "")}'.lower()
             
             # Check URL path (if available)
             # In Streamlit, we can check the current page name or use query params
-            if "confirm" in action or "confirm" in page:
+            if "confirm" in route:
                 self.render_confirm_page(token)
-            elif "reject" in action or "reject" in page:
+            elif "reject" in route:
                 self.render_reject_page(token)
             else:
                 # Default: show both options
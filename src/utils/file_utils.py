@@ -0,0 +1,12 @@
+"""
+File system helpers shared by the tools that write generated files.
+"""
+import os
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def ensure_dir(path: str) -> str:
+    """makedirs once per directory instead of on every call (failures are not cached)."""
+    os.makedirs(path, exist_ok=True)
+    return path
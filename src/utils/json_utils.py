@@ -0,0 +1,18 @@
+"""
+JSON helpers shared by the tools that POST JSON bodies.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps_bytes(value: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
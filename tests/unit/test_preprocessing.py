@@ -65,5 +65,13 @@ class TestPreprocessingService(unittest.TestCase):
         self.assertEqual(preprocessing_service.normalize_area("70.5 m2"), 70.5)
         self.assertEqual(preprocessing_service.normalize_area("100 mét vuông"), 100.0)
 
+    def test_normalize_cached_repeat(self):
+        logger.info("Testing repeated normalize calls (memoized)...")
+        for _ in range(3):
+            self.assertEqual(preprocessing_service.normalize_project("q7 riverside"), "Q7Riverside")
+            self.assertEqual(preprocessing_service.normalize_text("  Căn   Hộ  Q7 "), "căn hộ q7")
+        self.assertIsNone(preprocessing_service.normalize_project(""))
+        self.assertEqual(preprocessing_service.normalize_text(""), "")
+
 if __name__ == '__main__':
     unittest.main()
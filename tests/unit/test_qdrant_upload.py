@@ -0,0 +1,103 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import json
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+# Add src to path if needed (2 levels up: tests/unit -> project root)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.services.qdrant_service import QdrantService
+
+RECORDS = [
+    {
+        "ma_can": "A01", "toa": "M1", "tang": 5, "so_phong_ngu": 2, "so_phong_wc": 2,
+        "dien_tich": 70.5, "gia_ban": 3_000_000_000, "huong": "Đông Nam", "noi_that": "Full"
+    },
+    {
+        "ma_can": "B02", "toa": "RP1", "so_phong_ngu": 3,
+        "gia_ban": {"min": 4_000_000_000, "max": 5_000_000_000}, "view": "Sông"
+    },
+    {"ma_can": "C03", "gia_ban": {"max": 2_500_000_000}, "nhu_cau": "Bán"},
+    {"ma_can": "D04", "tang": 0, "gia_ban": None},
+]
+
+
+class TestQdrantUpload(unittest.TestCase):
+    """
+    Test cases for QdrantService.upload_from_json
+    """
+
+    @patch('src.services.qdrant_service.QdrantClient')
+    @patch('src.services.qdrant_service.config')
+    def setUp(self, mock_config, mock_qdrant_client):
+        mock_config.QDRANT_URL = "http://mock-qdrant:6333"
+        mock_config.QDRANT_API_KEY = "mock-key"
+        mock_config.QDRANT_COLLECTION = "apartments_test"
+
+        self.service = QdrantService()
+        self.mock_client_instance = self.service.client
+
+        fd, self.json_path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"data": RECORDS, "source_file": "test.xlsx", "batch_id": "b1"}, f, ensure_ascii=False)
+
+        # upload_points consumes the point generator like the real client
+        self.uploaded = []
+        self.mock_client_instance.upload_points.side_effect = (
+            lambda collection_name, points, **kwargs: self.uploaded.extend(points)
+        )
+
+        self.mock_embedding = MagicMock()
+        self.mock_embedding.vector_dimension = 4
+        self.mock_embedding.encode.side_effect = (
+            lambda texts, **kwargs: np.ones((len(texts), 4), dtype=np.float32)
+        )
+        patcher = patch('src.services.qdrant_service.embedding_service', self.mock_embedding)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        os.remove(self.json_path)
+
+    def _uploaded_points(self):
+        return self.uploaded
+
+    def test_upload_builds_text_representation(self):
+        """Every record is embedded and uploaded with its text representation"""
+        result = self.service.upload_from_json(self.json_path)
+
+        self.assertTrue(result["success"], result)
+        self.assertEqual(result["uploaded"], len(RECORDS))
+
+        points = self._uploaded_points()
+        self.assertEqual(len(points), len(RECORDS))
+        texts = {p.payload["ma_can"]: p.payload["text_representation"] for p in points}
+        self.assertEqual(
+            texts["A01"],
+            "Mã căn: A01. Tòa: M1. Tầng: 5. 2 phòng ngủ. 2 phòng WC. Diện tích: 70.5 m². "
+            "Giá: 3000 triệu. Hướng: Đông Nam. Nội thất: Full"
+        )
+        self.assertEqual(texts["B02"], "Mã căn: B02. Tòa: RP1. 3 phòng ngủ. Giá: 4000-5000 triệu. View: Sông")
+        self.assertEqual(texts["C03"], "Mã căn: C03. Giá: dưới 2500 triệu. Nhu cầu: Bán")
+        self.assertEqual(texts["D04"], "Mã căn: D04")
+
+        for point in points:
+            self.assertEqual(point.payload["source_file"], "test.xlsx")
+            self.assertEqual(point.payload["batch_id"], "b1")
+            self.assertEqual(len(point.vector), 4)
+        self.assertEqual(len({p.id for p in points}), len(RECORDS))
+
+    def test_upload_invalid_structure(self):
+        """A JSON file without a 'data' array is rejected"""
+        with open(self.json_path, "w", encoding="utf-8") as f:
+            json.dump({"rows": []}, f)
+
+        result = self.service.upload_from_json(self.json_path)
+        self.assertFalse(result["success"])
+
+if __name__ == '__main__':
+    unittest.main()
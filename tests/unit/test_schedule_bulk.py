@@ -0,0 +1,131 @@
+"""
+Unit tests for ScheduleService bulk bookings and admin calendar sync (JSON-backed repository)
+"""
+import unittest
+from unittest.mock import patch
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+# Add src to path (2 levels up: tests/unit -> project root)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.config import config
+from src.repositories.schedule_repository import ScheduleRepository
+from src.services.schedule_service import ScheduleService, _flush_calendar_syncs
+
+
+class TestScheduleBulk(unittest.TestCase):
+    """
+    Test cases for ScheduleService.create_bookings_bulk
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.calendar_path = os.path.join(self.tmp_dir.name, "admin_calendar.json")
+
+        for name, value in (
+            ("USE_MONGODB", False),
+            ("VISIT_SCHEDULES_FILE", os.path.join(self.tmp_dir.name, "visit_schedules.json")),
+            ("ADMIN_CALENDAR_FILE", self.calendar_path),
+        ):
+            patcher = patch.object(config, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.service = ScheduleService()
+        self.service.repo = ScheduleRepository()
+
+    def _read_calendar(self, expected_count: int, timeout: float = 5.0):
+        """Wait for the background calendar writer to catch up"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if os.path.exists(self.calendar_path):
+                with open(self.calendar_path, "r", encoding="utf-8") as fh:
+                    events = json.load(fh)
+                if len(events) >= expected_count:
+                    return events
+            time.sleep(0.05)
+        self.fail("Admin calendar file was not written")
+
+    def test_bulk_parses_each_time_once_and_reports_errors(self):
+        """Repeated time text is parsed once; bad rows are reported by index"""
+        payloads = [
+            {"district": "Quận 7", "time": "ngày mai 9h"},
+            {"district": "Quận 1", "time": "ngày mai 9h"},
+            {"district": "Quận 2", "time": "không rõ"},
+        ]
+        raw_messages = ["", "", ""]
+
+        with patch.object(self.service, "_parse_datetime", wraps=self.service._parse_datetime) as parse:
+            result = self.service.create_bookings_bulk(
+                user_session=None, payloads=payloads, raw_messages=raw_messages
+            )
+
+        # Rows 0 and 1 share a key; row 2 has its own
+        self.assertEqual(parse.call_count, 2)
+
+        created = result["created"]
+        self.assertEqual([event["district"] for event in created], ["Quận 7", "Quận 1"])
+        self.assertEqual(created[0]["requested_time"], created[1]["requested_time"])
+
+        self.assertEqual(len(result["errors"]), 1)
+        self.assertEqual(result["errors"][0]["index"], 2)
+        self.assertIn("thời gian", result["errors"][0]["error"])
+
+        calendar = self._read_calendar(len(created))
+        self.assertEqual({event["id"] for event in calendar}, {event["id"] for event in created})
+
+    def test_assignment_write_reaches_calendar(self):
+        """A later booking must not rewrite the calendar with a pre-assignment copy"""
+        first = self.service.create_bookings_bulk(
+            user_session=None,
+            payloads=[{"district": "Quận 7", "time": "ngày mai 9h"}],
+            raw_messages=[""],
+        )["created"][0]
+        self._read_calendar(1)
+
+        # The module-level AssignmentService connects a UserRepository on import
+        with patch('src.repositories.user_repository.UserRepository'):
+            from src.services.assignment_service import AssignmentService
+        assignment = AssignmentService.__new__(AssignmentService)
+        assignment.schedule_repo = self.service.repo
+        with patch('src.services.schedule_service.schedule_service', self.service):
+            assignment._update_assignment(first["id"], {"status": "assigned", "assigned_to_sale_id": "sale-1"})
+
+        self.service.create_bookings_bulk(
+            user_session=None,
+            payloads=[{"district": "Quận 1", "time": "ngày mai 10h"}],
+            raw_messages=[""],
+        )
+        deadline = time.monotonic() + 5.0
+        while time.monotonic() < deadline:
+            calendar = {event["id"]: event for event in self._read_calendar(2)}
+            if calendar[first["id"]].get("status") == "assigned":
+                break
+            time.sleep(0.05)
+        self.assertEqual(calendar[first["id"]]["status"], "assigned")
+        self.assertEqual(calendar[first["id"]]["assigned_to_sale_id"], "sale-1")
+
+    def test_pending_calendar_write_is_flushed(self):
+        """Services share one lazy worker; a pending sync is written by the exit flush"""
+        threads_before = threading.active_count()
+        ScheduleService()
+        self.assertEqual(threading.active_count(), threads_before)
+
+        self.service._sync_admin_calendar()
+        _flush_calendar_syncs()
+        self.assertTrue(os.path.exists(self.calendar_path))
+
+    def test_bulk_length_mismatch(self):
+        """Payloads and messages must line up"""
+        from src.core.exceptions import ValidationError
+        with self.assertRaises(ValidationError):
+            self.service.create_bookings_bulk(user_session=None, payloads=[{}], raw_messages=[])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Unit tests for ScheduleService Vietnamese time phrase parsing
+"""
+import unittest
+import sys
+import os
+from datetime import datetime
+
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Add src to path (2 levels up: tests/unit -> project root)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.services.schedule_service import ScheduleService
+
+# Saturday afternoon
+BASE_DT = datetime(2026, 10, 17, 15, 7)
+
+
+class TestScheduleTimeParser(unittest.TestCase):
+
+    def test_relative_day_with_time(self):
+        logger.info("Testing relative day phrases...")
+        cases = {
+            "ngày mai 9h": datetime(2026, 10, 18, 9, 0),
+            "7 giờ rưỡi chiều mai": datetime(2026, 10, 18, 19, 30),
+            "mốt 5h chiều": datetime(2026, 10, 19, 17, 0),
+            "12h trưa mai": datetime(2026, 10, 18, 12, 0),
+            "hôm nay 8h tối": datetime(2026, 10, 17, 20, 0),
+            "mai, lúc 10:30": datetime(2026, 10, 18, 10, 30),
+        }
+        for text, expected in cases.items():
+            logger.info(f"  Input: '{text}' -> Expected: {expected}")
+            self.assertEqual(ScheduleService._parse_vn_phrase(text, BASE_DT), expected)
+
+    def test_weekday_with_time(self):
+        logger.info("Testing weekday phrases...")
+        cases = {
+            "10h sáng thứ 7 tuần sau": datetime(2026, 10, 24, 10, 0),
+            "Thứ Hai tuần sau 10h": datetime(2026, 10, 26, 10, 0),
+            "thứ ba tuần này 3h chiều": datetime(2026, 10, 20, 15, 0),
+            "17h30 thứ 5": datetime(2026, 10, 22, 17, 30),
+            "9 giờ 15 phút sáng thứ tư": datetime(2026, 10, 21, 9, 15),
+            "cn 7h tối": datetime(2026, 10, 18, 19, 0),
+        }
+        for text, expected in cases.items():
+            logger.info(f"  Input: '{text}' -> Expected: {expected}")
+            self.assertEqual(ScheduleService._parse_vn_phrase(text, BASE_DT), expected)
+
+    def test_relative_time_keeps_time_of_day(self):
+        logger.info("Testing relative-time phrases via dateparser...")
+        cases = {
+            "in 2 hours": datetime(2026, 10, 17, 17, 7),
+            "2 hours later": datetime(2026, 10, 17, 17, 7),
+            "in 30 minutes": datetime(2026, 10, 17, 15, 37),
+        }
+        for text, expected in cases.items():
+            logger.info(f"  Input: '{text}' -> Expected: {expected}")
+            self.assertEqual(ScheduleService._parse_single_candidate(text, BASE_DT), expected)
+
+    def test_rejects_unsupported_text(self):
+        logger.info("Testing phrases left to dateparser...")
+        for text in ["", "8h", "25h", "10h70", "thứ 8", "xem nhà mai", "tuần sau", "tomorrow 10am",
+                     "thứ 2", "THỨ 7", "tối nay", "hôm nay", "chiều mai"]:
+            logger.info(f"  Input: '{text}' -> Expected: None")
+            self.assertIsNone(ScheduleService._parse_vn_phrase(text, BASE_DT))
+
+if __name__ == '__main__':
+    unittest.main()
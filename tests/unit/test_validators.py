@@ -2,6 +2,7 @@
 Unit tests for SlotValidator
 """
 import unittest
+from unittest.mock import patch
 import sys
 import os
 
@@ -62,6 +63,13 @@ class TestSlotValidator(unittest.TestCase):
         self.assertIsNotNone(slot_validator.validate_area(5)) # Too small
         self.assertIsNotNone(slot_validator.validate_area(20000)) # Too big
 
+    def test_messages_follow_overridden_bounds(self):
+        logger.info("Testing error text uses the enforced bounds...")
+        with patch.object(settings, "MAX_BEDROOMS", 5), patch.object(settings, "MIN_AREA", 30):
+            self.assertEqual(slot_validator.validate_bedrooms(6), "Số phòng ngủ tối đa là 5.")
+            self.assertEqual(slot_validator.validate_area(20), "Diện tích có vẻ quá nhỏ (dưới 30m2).")
+        self.assertEqual(slot_validator.validate_bedrooms(11), f"Số phòng ngủ tối đa là {settings.MAX_BEDROOMS}.")
+
     def test_validate_slots(self):
         logger.info("Testing validate_slots (combined)...")
         